@@ -1,10 +1,15 @@
 import firebase_admin
 from firebase_admin import credentials, storage
 from google.cloud import storage as gcp_storage
+from google.cloud.storage.retry import DEFAULT_RETRY
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import zipfile
 import io
 import os
+import tempfile
 import json
 import base64
 from typing import Dict, Optional
@@ -46,6 +51,17 @@ class FirebaseStorage:
             self.logger.error(f"❌ Upload failed: {e}")
             return False
     
+    def upload_fileobj(self, file_obj, remote_path: str, size: Optional[int] = None) -> bool:
+        """Upload an open file object to Firebase Storage"""
+        try:
+            blob = self.bucket.blob(remote_path)
+            blob.upload_from_file(file_obj, rewind=False, size=size)
+            self.logger.info(f"✅ Uploaded stream to {remote_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ Upload failed: {e}")
+            return False
+    
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """Download file from Firebase Storage"""
         try:
@@ -88,28 +104,63 @@ class FirebaseStorage:
 class CloudStorage:
     """Google Cloud Storage utility as alternative to Firebase"""
     
+    # (connect, read) timeouts in seconds and per-call retry budget
+    TIMEOUT = (10, 300)
+    RETRY = DEFAULT_RETRY.with_deadline(60)
+    
     def __init__(self, bucket_name: Optional[str] = None):
         self.bucket_name = bucket_name or os.getenv('GCS_BUCKET')
-        self.client = gcp_storage.Client()
+        credentials, project = google.auth.default()
+        self.client = gcp_storage.Client(
+            project=project,
+            credentials=credentials,
+            _http=self._build_http_session(credentials)
+        )
         self.bucket = self.client.bucket(self.bucket_name)
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _build_http_session(credentials) -> AuthorizedSession:
+        """
+        Create an authorized session with pooled connections. Retries are left
+        to the per-call RETRY policy so failed requests are not retried twice.
+        """
+        session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def upload_file(self, local_path: str, remote_path: str) -> bool:
         """Upload file to Google Cloud Storage"""
         try:
             blob = self.bucket.blob(remote_path)
-            blob.upload_from_filename(local_path)
+            blob.upload_from_filename(local_path, timeout=self.TIMEOUT, retry=self.RETRY)
             self.logger.info(f"✅ Uploaded {local_path} to {remote_path}")
             return True
         except Exception as e:
             self.logger.error(f"❌ GCS Upload failed: {e}")
             return False
     
+    def upload_fileobj(self, file_obj, remote_path: str, size: Optional[int] = None) -> bool:
+        """Upload an open file object to Google Cloud Storage"""
+        try:
+            blob = self.bucket.blob(remote_path)
+            blob.upload_from_file(
+                file_obj, rewind=False, size=size,
+                timeout=self.TIMEOUT, retry=self.RETRY
+            )
+            self.logger.info(f"✅ Uploaded stream to {remote_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ GCS Upload failed: {e}")
+            return False
+    
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """Download file from Google Cloud Storage"""
         try:
             blob = self.bucket.blob(remote_path)
-            blob.download_to_filename(local_path)
+            blob.download_to_filename(local_path, timeout=self.TIMEOUT, retry=self.RETRY)
             self.logger.info(f"✅ Downloaded {remote_path} to {local_path}")
             return True
         except Exception as e:
@@ -209,17 +260,23 @@ def save_model_to_cloud(model, model_name: str, storage_backend: str = None) ->
     storage = get_storage_backend(storage_backend)
     manager = ModelStorageManager()
     
-    # Create temporary local file
-    temp_path = f"/tmp/{model_name}.pkl"
-    try:
-        if hasattr(model, 'save_model'):
+    remote_path = f"models/{model_name}.pkl"
+    
+    if hasattr(model, 'save_model'):
+        # Trainer wrappers persist themselves to a path
+        temp_path = f"/tmp/{model_name}.pkl"
+        try:
             model.save_model(temp_path)
-        else:
-            import joblib
-            joblib.dump(model, temp_path)
-        
-        return storage.upload_file(temp_path, f"models/{model_name}.pkl")
-    finally:
-        # Clean up temp file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
\ No newline at end of file
+            return storage.upload_file(temp_path, remote_path)
+        finally:
+            # Clean up temp file
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    # Serialize in memory, spilling to disk only for very large models
+    import joblib
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+        joblib.dump(model, buffer, protocol=5, compress=('zlib', 3))
+        size = buffer.tell()
+        buffer.seek(0)
+        return storage.upload_fileobj(buffer, remote_path, size=size)
\ No newline at end of file
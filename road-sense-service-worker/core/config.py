@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     
     # Model Paths
     TIRE_MODEL_PATH: str = "models/tire_degradation.pkl"
+    TIRE_MODEL_LIB_PATH: str = "models/tire_degradation.so"
     FUEL_MODEL_PATH: str = "models/fuel_consumption.pkl"
     
     class Config:
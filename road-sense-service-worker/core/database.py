@@ -1,5 +1,15 @@
+import os
 import redis
 from core.config import settings
 
+# Shared pool so workers reuse sockets instead of reconnecting on every call
+_pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    max_connections=int(os.getenv("REDIS_POOL_SIZE", 50)),
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
 def get_redis_connection():
-    return redis.from_url(settings.REDIS_URL, decode_responses=True)
\ No newline at end of file
+    return redis.Redis(connection_pool=_pool)
@@ -11,9 +11,12 @@ app = Celery('road_sense_worker',
              backend=settings.REDIS_URL)
 
 app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],  # json until every producer sends msgpack
+    result_serializer='msgpack',
+    result_accept_content=['msgpack', 'json'],
+    task_compression='zstd',
+    result_compression='zstd',
     timezone='UTC',
     enable_utc=True,
     task_routes={
@@ -2,24 +2,89 @@
 import pandas as pd
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # numba is optional; fall back to chained NumPy ops
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _telemetry_kernel(distance, lateral, rpm, throttle, fuel, lap, opt,
+                          out_wear, out_fuel, out_delta, out_degradation):
+        # Single fused pass over the batch for all per-row metrics
+        for i in numba.prange(distance.shape[0]):
+            out_wear[i] = min(100.0, distance[i] * lateral[i] * 0.001)
+            out_fuel[i] = max(0.0, fuel[i] - rpm[i] * throttle[i] * 0.0001)
+            out_delta[i] = lap[i] - opt[i]
+            out_degradation[i] = max(0.0, out_delta[i] / opt[i])
+
 class TelemetryProcessor:
-    def calculate_tire_wear(self, batch_data: dict) -> float:
+    @staticmethod
+    def to_frame(batch_data) -> pd.DataFrame:
+        # Accept a single telemetry record, a dict of columns or a list of records
+        if isinstance(batch_data, pd.DataFrame):
+            return batch_data
+        if isinstance(batch_data, dict) and not any(
+            isinstance(value, (list, tuple, np.ndarray)) for value in batch_data.values()
+        ):
+            return pd.DataFrame([batch_data])
+        return pd.DataFrame(batch_data)
+    
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str, default: float) -> np.ndarray:
+        if name in df:
+            return df[name].fillna(default).to_numpy(dtype=np.float64)
+        return np.full(len(df), default, dtype=np.float64)
+    
+    def calculate_tire_wear(self, batch_data: pd.DataFrame) -> np.ndarray:
         # Simple tire wear calculation based on distance and forces
-        distance = batch_data.get('distance', 0)
-        lateral_force = batch_data.get('lateral_force', 1.0)
-        return min(100.0, distance * lateral_force * 0.001)
+        distance = self._column(batch_data, 'distance', 0)
+        lateral_force = self._column(batch_data, 'lateral_force', 1.0)
+        return np.minimum(100.0, distance * lateral_force * 0.001)
     
-    def calculate_fuel_usage(self, batch_data: dict) -> float:
+    def calculate_fuel_usage(self, batch_data: pd.DataFrame) -> np.ndarray:
         # Fuel consumption based on RPM and throttle
-        rpm = batch_data.get('rpm', 8000)
-        throttle = batch_data.get('throttle', 0.8)
-        return max(0, batch_data.get('fuel_remaining', 100) - (rpm * throttle * 0.0001))
+        rpm = self._column(batch_data, 'rpm', 8000)
+        throttle = self._column(batch_data, 'throttle', 0.8)
+        fuel_remaining = self._column(batch_data, 'fuel_remaining', 100)
+        return np.maximum(0.0, fuel_remaining - rpm * throttle * 0.0001)
     
-    def analyze_pace(self, batch_data: dict) -> dict:
+    def analyze_pace(self, batch_data: pd.DataFrame) -> dict:
         # Pace analysis comparing to optimal lap
-        current_lap_time = batch_data.get('lap_time', 90.0)
-        optimal_lap_time = batch_data.get('optimal_lap', 85.0)
+        current_lap_time = self._column(batch_data, 'lap_time', 90.0)
+        optimal_lap_time = self._column(batch_data, 'optimal_lap', 85.0)
+        delta = current_lap_time - optimal_lap_time
         return {
-            'pace_delta': current_lap_time - optimal_lap_time,
-            'pace_degradation': max(0, (current_lap_time - optimal_lap_time) / optimal_lap_time)
-        }
\ No newline at end of file
+            'pace_delta': delta,
+            'pace_degradation': np.maximum(0.0, delta / optimal_lap_time)
+        }
+    
+    def process_batch(self, batch_data: pd.DataFrame) -> tuple:
+        # Fused tire wear, fuel and pace computation for a whole batch
+        if numba is None:
+            pace = self.analyze_pace(batch_data)
+            return (
+                self.calculate_tire_wear(batch_data),
+                self.calculate_fuel_usage(batch_data),
+                pace
+            )
+        
+        size = len(batch_data)
+        out_wear = np.empty(size, dtype=np.float64)
+        out_fuel = np.empty(size, dtype=np.float64)
+        out_delta = np.empty(size, dtype=np.float64)
+        out_degradation = np.empty(size, dtype=np.float64)
+        _telemetry_kernel(
+            self._column(batch_data, 'distance', 0),
+            self._column(batch_data, 'lateral_force', 1.0),
+            self._column(batch_data, 'rpm', 8000),
+            self._column(batch_data, 'throttle', 0.8),
+            self._column(batch_data, 'fuel_remaining', 100),
+            self._column(batch_data, 'lap_time', 90.0),
+            self._column(batch_data, 'optimal_lap', 85.0),
+            out_wear, out_fuel, out_delta, out_degradation
+        )
+        return out_wear, out_fuel, {
+            'pace_delta': out_delta,
+            'pace_degradation': out_degradation
+        }
@@ -1,4 +1,5 @@
 from main import app 
+import numpy as np
 
 
 class RaceSimulator:
@@ -10,6 +11,18 @@ class RaceSimulator:
         # implementation  
         pass
     
+    def rank_scenarios(self, scenarios):
+        # Order scenarios by expected gain, best first
+        if not scenarios:
+            return []
+        gains = np.fromiter(
+            (scenario['expected_gain'] for scenario in scenarios),
+            dtype=np.float32,
+            count=len(scenarios)
+        )
+        order = np.argsort(-gains, kind='stable')
+        return [scenarios[i] for i in order]
+    
 
 
 @app.task(bind=True, time_limit=300)
@@ -1,37 +1,37 @@
 from main import app 
+import operator
 
+# (metric, comparison, threshold, message template, type, priority, recommended action)
+ALERT_RULES = (
+    ('tire_wear', operator.gt, 80, 'High tire wear - Consider pit stop soon',
+     'CRITICAL', 'high', 'pit_within_3_laps'),
+    ('fuel_laps_remaining', operator.lt, 5, 'Low fuel - %.1f laps remaining',
+     'WARNING', 'medium', 'conserve_fuel'),
+    ('pace_degradation', operator.gt, 0.5, 'Pace degradation detected - check tire strategy',
+     'INFO', 'low', 'analyze_tire_performance'),
+)
 
 @app.task
 def generate_strategy_alerts(race_state: dict):
     """Generate real-time strategy alerts"""
-    alerts = []
+    tire_wear, fuel_remaining, avg_fuel_consumption, pace_degradation = map(
+        race_state.__getitem__,
+        ('tire_wear', 'fuel_remaining', 'avg_fuel_consumption', 'pace_degradation')
+    )
+    metrics = {
+        'tire_wear': tire_wear,
+        'fuel_laps_remaining': fuel_remaining / avg_fuel_consumption,
+        'pace_degradation': pace_degradation,
+    }
     
-    # Tire wear alerts
-    if race_state['tire_wear'] > 80:
-        alerts.append({
-            'type': 'CRITICAL',
-            'message': 'High tire wear - Consider pit stop soon',
-            'priority': 'high',
-            'recommended_action': 'pit_within_3_laps'
-        })
-    
-    # Fuel strategy alerts
-    fuel_laps_remaining = race_state['fuel_remaining'] / race_state['avg_fuel_consumption']
-    if fuel_laps_remaining < 5:
-        alerts.append({
-            'type': 'WARNING', 
-            'message': f'Low fuel - {fuel_laps_remaining:.1f} laps remaining',
-            'priority': 'medium',
-            'recommended_action': 'conserve_fuel'
-        })
-    
-    # Pace degradation alerts
-    if race_state['pace_degradation'] > 0.5:
-        alerts.append({
-            'type': 'INFO',
-            'message': 'Pace degradation detected - check tire strategy',
-            'priority': 'low',
-            'recommended_action': 'analyze_tire_performance'
-        })
-    
-    return alerts
\ No newline at end of file
+    # Messages are only formatted for rules that actually fire
+    return [
+        {
+            'type': type_,
+            'message': template % metrics[metric] if '%' in template else template,
+            'priority': priority,
+            'recommended_action': action
+        }
+        for metric, compare, threshold, template, type_, priority, action in ALERT_RULES
+        if compare(metrics[metric], threshold)
+    ]
@@ -1,40 +1,102 @@
 from main import app 
+import os
+import threading
 import joblib
 import numpy as np
+from core.config import settings
+
+try:
+    import treelite_runtime
+except ImportError:  # compiled predictor is optional; fall back to sklearn
+    treelite_runtime = None
+
+# Per-process model cache, reloaded only when the pickle changes on disk
+_TIRE_MODEL = None
+_TIRE_MTIME = 0
+
+# Reusable per-thread (1, 4) feature row, safe under threaded worker pools
+_FEATURE_BUF = threading.local()
+
+class _CompiledTireModel:
+    """Treelite-compiled tire model exposing the sklearn predict interface"""
+    
+    def __init__(self, path: str):
+        self.predictor = treelite_runtime.Predictor(path, verbose=False)
+    
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return np.ravel(self.predictor.predict(treelite_runtime.DMatrix(features)))
+
+def _get_tire_model():
+    """Return the cached tire model, preferring the compiled predictor if built"""
+    global _TIRE_MODEL, _TIRE_MTIME
+    compiled = treelite_runtime is not None and os.path.exists(settings.TIRE_MODEL_LIB_PATH)
+    path = settings.TIRE_MODEL_LIB_PATH if compiled else settings.TIRE_MODEL_PATH
+    mtime = os.path.getmtime(path)
+    if _TIRE_MODEL is None or mtime != _TIRE_MTIME:
+        if compiled:
+            _TIRE_MODEL = _CompiledTireModel(path)
+        else:
+            _TIRE_MODEL = joblib.load(path, mmap_mode='r')
+        _TIRE_MTIME = mtime
+    return _TIRE_MODEL
+
+def _get_feature_buffer() -> np.ndarray:
+    buffer = getattr(_FEATURE_BUF, 'row', None)
+    if buffer is None:
+        buffer = _FEATURE_BUF.row = np.empty((1, 4), dtype=np.float32)
+    return buffer
+
+# Refinement passes used to converge the rolled-forward wear column
+WEAR_REFINE_PASSES = 2
+
+def _forecast_wear(tire_model, features: np.ndarray, laps_ahead: int) -> np.ndarray:
+    """Forecast cumulative tire wear for the next laps with batched predictions"""
+    current_wear = float(features[0, 0])
+    
+    # One row per future lap: [wear, lap, track_temp, lateral_forces]
+    features_matrix = np.empty((laps_ahead, 4), dtype=np.float32)
+    features_matrix[:, 1] = features[0, 1] + np.arange(laps_ahead)
+    features_matrix[:, 2] = features[0, 2]
+    features_matrix[:, 3] = features[0, 3]
+    
+    # Warm-up: assume a constant wear rate, then refine the wear column
+    wear_rate = tire_model.predict(features)[0]
+    wear_rates = np.full(laps_ahead, wear_rate, dtype=np.float64)
+    for _ in range(WEAR_REFINE_PASSES):
+        features_matrix[0, 0] = current_wear
+        features_matrix[1:, 0] = current_wear + np.cumsum(wear_rates[:-1])
+        wear_rates = np.asarray(tire_model.predict(features_matrix), dtype=np.float64)
+    
+    return current_wear + np.cumsum(wear_rates)
 
 @app.task
 def predict_tire_degradation(telemetry_data: dict, laps_ahead: int = 10):
     """Predict tire wear for future laps"""
     try:
         # Load pre-trained model
-        tire_model = joblib.load('models/tire_degradation.pkl')
+        tire_model = _get_tire_model()
         
-        # Prepare features
-        features = np.array([
-            telemetry_data['current_wear'],
-            telemetry_data['lap_count'],
-            telemetry_data['track_temp'],
-            telemetry_data['lateral_forces']
-        ]).reshape(1, -1)
+        # Prepare features in the preallocated buffer
+        features = _get_feature_buffer()
+        features[0, 0] = telemetry_data['current_wear']
+        features[0, 1] = telemetry_data['lap_count']
+        features[0, 2] = telemetry_data['track_temp']
+        features[0, 3] = telemetry_data['lateral_forces']
+        
+        if laps_ahead <= 0:
+            return []
         
         # Predict degradation
-        predictions = []
-        current_wear = features[0][0]
+        wear_forecast = _forecast_wear(tire_model, features, laps_ahead)
         
-        for lap in range(laps_ahead):
-            wear_rate = tire_model.predict(features)[0]
-            current_wear += wear_rate
-            predictions.append({
+        return [
+            {
                 'lap': telemetry_data['lap_count'] + lap + 1,
-                'predicted_wear': min(current_wear, 100.0),
-                'critical': current_wear > 80.0
-            })
-            
-            # Update features for next prediction
-            features[0][0] = current_wear
-            features[0][1] += 1
-        
-        return predictions
+                'predicted_wear': min(float(wear), 100.0),
+                'critical': bool(wear > 80.0)
+            }
+            for lap, wear in enumerate(wear_forecast)
+        ]
         
     except Exception as exc:
-        return {'error': f'Tire prediction failed: {str(exc)}'}
\ No newline at end of file
+        return {'error': f'Tire prediction failed: {str(exc)}'}
@@ -1,32 +1,55 @@
 from main import app 
-from celery import current_app
-import pandas as pd
+import time
 from utils.data_processor import TelemetryProcessor
 
+# Second-resolution ISO prefix, recomputed at most once per second
+_TS_SECOND = None
+_TS_PREFIX = ''
+
+def _utc_timestamp() -> str:
+    global _TS_SECOND, _TS_PREFIX
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _TS_SECOND:
+        _TS_PREFIX = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _TS_SECOND = second
+    return f'{_TS_PREFIX}.{nanos // 1000:06d}'
+
+def _to_native(values, single: bool):
+    # Keep the scalar payload shape for single-record batches
+    return values.item() if single else values.tolist()
+
 @app.task(bind=True, max_retries=3)
-def process_telemetry_batch(self, batch_data: dict):
+def process_telemetry_batch(self, batch_data):
     """Process real-time telemetry data"""
     try:
         processor = TelemetryProcessor()
+        frame = processor.to_frame(batch_data)
+        single = len(frame) == 1
         
-        # Calculate key metrics
-        tire_wear = processor.calculate_tire_wear(batch_data)
-        fuel_consumption = processor.calculate_fuel_usage(batch_data)
-        pace_analysis = processor.analyze_pace(batch_data)
+        # Calculate key metrics for the whole batch at once
+        tire_wear, fuel_consumption, pace_analysis = processor.process_batch(frame)
         
         # Store processed data
         result = {
-            'tire_wear': tire_wear,
-            'fuel_remaining': fuel_consumption,
-            'pace_metrics': pace_analysis,
-            'timestamp': pd.Timestamp.now().isoformat()
+            'tire_wear': _to_native(tire_wear, single),
+            'fuel_remaining': _to_native(fuel_consumption, single),
+            'pace_metrics': {
+                key: _to_native(values, single)
+                for key, values in pace_analysis.items()
+            },
+            'timestamp': _utc_timestamp()
         }
         
-        # Trigger real-time analysis
-        current_app.send_task(
-            'workers.prediction_worker.analyze_race_state',
-            kwargs={'processed_data': result}
-        )
+        # Trigger real-time analysis on a pooled producer connection
+        with app.producer_pool.acquire(block=True) as producer:
+            app.send_task(
+                'workers.prediction_worker.analyze_race_state',
+                kwargs={'processed_data': result},
+                queue='prediction',
+                priority=5,
+                retry=False,
+                producer=producer
+            )
         
         return result
         
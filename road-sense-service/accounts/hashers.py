@@ -0,0 +1,10 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id tuned to the OWASP minimum (m=46 MiB, t=2, p=1) so interactive
+    login and registration stay well under the 500ms budget
+    """
+    time_cost = 2
+    memory_cost = 46 * 1024  # KiB
+    parallelism = 1
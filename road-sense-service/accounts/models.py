@@ -26,9 +26,19 @@ class User(AbstractUser):
     )
     last_activity = models.DateTimeField(default=timezone.now)
     
+    # Minimum seconds between persisted last_activity updates
+    ACTIVITY_UPDATE_INTERVAL = 30
+    
+    # Cached /me payload, dropped whenever the user row is saved
+    PAYLOAD_CACHE_KEY = 'user_payload:{}'
+    PAYLOAD_CACHE_TTL = 30
+    
     def update_activity(self):
-        """Update last activity timestamp"""
-        self.last_activity = timezone.now()
+        """Update last activity timestamp, skipping writes while still recent"""
+        now = timezone.now()
+        if self.last_activity and (now - self.last_activity).total_seconds() < self.ACTIVITY_UPDATE_INTERVAL:
+            return
+        self.last_activity = now
         self.save(update_fields=['last_activity'])
     
     def has_permission(self, permission):
@@ -21,12 +21,43 @@ class UserLoginSerializer(serializers.Serializer):
         raise serializers.ValidationError('Must include "username" and "password".')
 
 class UserSerializer(serializers.ModelSerializer):
+    password = serializers.CharField(write_only=True, required=False)
+    permissions = serializers.SerializerMethodField()
+    
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'role', 
                  'team', 'can_access_live_data', 'can_modify_strategy', 
-                 'can_acknowledge_alerts', 'preferred_vehicle', 'last_activity']
+                 'can_acknowledge_alerts', 'preferred_vehicle', 'last_activity',
+                 'permissions', 'password']
         read_only_fields = ['last_activity']
+    
+    @classmethod
+    def model_field_names(cls):
+        """Model columns rendered by this serializer, for .only() projections"""
+        return [field for field in cls.Meta.fields if field not in ('permissions', 'password')]
+    
+    def get_permissions(self, obj):
+        return {
+            'can_access_live_data': obj.can_access_live_data,
+            'can_modify_strategy': obj.can_modify_strategy,
+            'can_acknowledge_alerts': obj.can_acknowledge_alerts,
+        }
+    
+    def create(self, validated_data):
+        # Hash the password before the initial INSERT
+        password = validated_data.pop('password', None)
+        user = User(**validated_data)
+        if password:
+            user.set_password(password)
+        user.save()
+        return user
+    
+    def update(self, instance, validated_data):
+        password = validated_data.pop('password', None)
+        if password:
+            instance.set_password(password)
+        return super().update(instance, validated_data)
 
 class UserSessionSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
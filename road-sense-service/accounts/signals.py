@@ -0,0 +1,11 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import User
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_payload(sender, instance, **kwargs):
+    """
+    Drop the cached /me payload whenever the user changes
+    """
+    cache.delete(User.PAYLOAD_CACHE_KEY.format(instance.pk))
@@ -0,0 +1,11 @@
+from celery import shared_task
+from django.core.cache import cache
+from django.utils import timezone
+from .models import User
+
+@shared_task(ignore_result=True)
+def record_login_activity(user_id):
+    """Record the login activity timestamp outside the request cycle"""
+    User.objects.filter(pk=user_id).update(last_activity=timezone.now())
+    # .update() skips post_save, so drop the cached /me payload here
+    cache.delete(User.PAYLOAD_CACHE_KEY.format(user_id))
@@ -1,3 +1,99 @@
-from django.test import TestCase
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from kombu.exceptions import OperationalError
+import orjson
 
-# Create your tests here.
+from telemetry.models import Vehicle
+
+from .models import User, UserSession
+from .serializers import UserSessionSerializer
+from .tasks import record_login_activity
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PASSWORD_HASHERS=FAST_HASHERS)
+class ChangePasswordTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='driver', password='old-password-1')
+        self.client.login(username='driver', password='old-password-1')
+        self.current = UserSession.objects.create(user=self.user, session_key=self.client.session.session_key)
+        self.other = UserSession.objects.create(user=self.user, session_key='other-session-key')
+    
+    def test_current_session_survives_and_others_are_closed(self):
+        response = self.client.post('/api/accounts/auth/change-password/', {
+            'old_password': 'old-password-1',
+            'new_password': 'new-password-2',
+        })
+        self.assertEqual(response.status_code, 200)
+        
+        self.other.refresh_from_db()
+        self.current.refresh_from_db()
+        self.assertFalse(self.other.is_active)
+        self.assertTrue(self.current.is_active)
+        # The session key is cycled and the tracking row follows it
+        self.assertEqual(self.current.session_key, self.client.session.session_key)
+        
+        me = self.client.get('/api/accounts/auth/me/')
+        self.assertEqual(me.status_code, 200)
+        self.assertEqual(me.json()['user']['username'], 'driver')
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PASSWORD_HASHERS=FAST_HASHERS)
+class LoginTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='driver', password='password-1')
+    
+    def test_login_records_activity_inline_when_broker_is_down(self):
+        created_activity = self.user.last_activity
+        with mock.patch('accounts.views.record_login_activity.delay', side_effect=OperationalError):
+            response = self.client.post('/api/accounts/auth/login/', {
+                'username': 'driver',
+                'password': 'password-1',
+            })
+        self.assertEqual(response.status_code, 200)
+        
+        session = UserSession.objects.get(user=self.user)
+        self.assertEqual(response.json()['session']['id'], session.id)
+        self.assertEqual(session.session_key, self.client.session.session_key)
+        self.user.refresh_from_db()
+        self.assertGreater(self.user.last_activity, created_activity)
+    
+    def test_login_activity_task_invalidates_cached_payload(self):
+        cache_key = User.PAYLOAD_CACHE_KEY.format(self.user.id)
+        cache.set(cache_key, {'user': {}})
+        
+        record_login_activity(self.user.id)
+        
+        self.assertIsNone(cache.get(cache_key))
+
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PASSWORD_HASHERS=FAST_HASHERS)
+class ActiveSessionsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        admin = User.objects.create_user(username='admin', password='password-1', is_staff=True)
+        vehicle = Vehicle.objects.create(number=86, team='Toyota GR Team', driver='Driver', vehicle_id='GR86-086-000')
+        driver = User.objects.create_user(username='driver', password='password-1', preferred_vehicle=vehicle)
+        UserSession.objects.create(user=admin, session_key='admin-key', ip_address='10.0.0.1')
+        UserSession.objects.create(user=driver, session_key='driver-key', ip_address='10.0.0.2')
+        UserSession.objects.create(user=driver, session_key='closed-key', is_active=False)
+        self.client.login(username='admin', password='password-1')
+    
+    def test_streamed_rows_match_serializer_output(self):
+        response = self.client.get('/api/accounts/sessions/active/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        
+        body = b''.join(response.streaming_content)
+        rows = [orjson.loads(line) for line in body.splitlines()]
+        
+        expected = UserSessionSerializer(
+            UserSession.objects.filter(is_active=True).order_by('-login_time'), many=True
+        ).data
+        self.assertEqual(rows, expected)
@@ -1,8 +1,9 @@
-from rest_framework import viewsets, status, permissions
+from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.decorators import action, api_view, permission_classes
 from django.utils.decorators import method_decorator
 from rest_framework.response import Response
-from django.contrib.auth import login, logout
+from django.contrib.auth import login, logout, update_session_auth_hash
+from django.core.cache import cache
 from django.utils import timezone
 from django.middleware.csrf import get_token
 import logging
@@ -13,9 +14,12 @@ from .serializers import (
     UserSessionSerializer, ChangePasswordSerializer
 )
 from .permissions import IsTeamMember, CanModifyStrategy, CanAcknowledgeAlerts
+from .tasks import record_login_activity
 
 from django.views.decorators.csrf import ensure_csrf_cookie
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+import orjson
+from operator import attrgetter
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
@@ -32,6 +36,44 @@ def csrf_token(request):
 
 logger = logging.getLogger(__name__)
 
+def _client_ip(meta):
+    """Extract client IP address from request META"""
+    x_forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
+    if not x_forwarded_for:
+        return meta.get('REMOTE_ADDR')
+    if ',' in x_forwarded_for:
+        # Only the first hop matters; stop at the first comma
+        return x_forwarded_for.split(',', 1)[0].strip()
+    return x_forwarded_for
+
+def _row_builder(serializer):
+    """
+    Build a function that renders a model instance to the same plain dict as
+    serializer.data, with the field lookups resolved once up front
+    """
+    model_meta = serializer.Meta.model._meta
+    getters = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.BaseSerializer):
+            getters.append((name, _nested_getter(field.source, _row_builder(field))))
+        elif isinstance(field, serializers.SerializerMethodField):
+            getters.append((name, getattr(serializer, field.method_name)))
+        else:
+            # attname reads foreign keys as their raw id, like PrimaryKeyRelatedField
+            getters.append((name, attrgetter(model_meta.get_field(field.source).attname)))
+    
+    def build(instance):
+        return {name: getter(instance) for name, getter in getters}
+    return build
+
+def _nested_getter(source, build):
+    """Render the related object at source with a nested row builder"""
+    def get(instance):
+        return build(getattr(instance, source))
+    return get
+
 class AuthViewSet(viewsets.ViewSet):
     """
     Authentication endpoints for user login/logout
@@ -55,7 +97,7 @@ class AuthViewSet(viewsets.ViewSet):
     #         session = UserSession.objects.create(
     #             user=user,
     #             session_key=request.session.session_key,
-    #             ip_address=self._get_client_ip(request),
+    #             ip_address=_client_ip(request.META),
     #             user_agent=request.META.get('HTTP_USER_AGENT', '')
     #         )
             
@@ -94,29 +136,33 @@ class AuthViewSet(viewsets.ViewSet):
         # Login user (Django handles session creation)
         login(request, user)
         
-        # Create user session tracking
+        # Track the session; its id is part of the login response
         session = UserSession.objects.create(
             user=user,
             session_key=request.session.session_key,
-            ip_address=self._get_client_ip(request),
+            ip_address=_client_ip(request.META),
             user_agent=request.META.get('HTTP_USER_AGENT', '')
         )
         
-        # Update user activity
-        user.update_activity()
+        # Activity is written by a background task; fall back to writing it
+        # inline if the broker is unreachable so login still succeeds
+        try:
+            record_login_activity.delay(user.id)
+        except Exception:
+            logger.exception("Could not queue login activity, recording inline")
+            record_login_activity(user.id)
+        user.last_activity = session.login_time
         
         logger.info(f"User {user.username} logged in from {session.ip_address}")
         
+        user_data = UserSerializer(user).data
+        
         # Create response with CSRF cookie
         response = Response({
             'message': 'Login successful',
-            'user': UserSerializer(user).data,
+            'user': user_data,
             'session': UserSessionSerializer(session).data,
-            'permissions': {
-                'can_access_live_data': user.can_access_live_data,
-                'can_modify_strategy': user.can_modify_strategy,
-                'can_acknowledge_alerts': user.can_acknowledge_alerts,
-            }
+            'permissions': user_data['permissions']
         }, status=status.HTTP_200_OK)
         
         # Ensure CSRF token is set as cookie
@@ -128,8 +174,8 @@ class AuthViewSet(viewsets.ViewSet):
     def user_logout(self, request):
         """User logout with session cleanup"""
         if request.user.is_authenticated:
-            # FIX: Check if session exists before using session_key
-            session_key = request.session.session_key if request.session.exists() else None
+            # Cache-backed sessions: a loaded session always carries its key
+            session_key = request.session.session_key
             
             if session_key:
                 UserSession.objects.filter(
@@ -158,15 +204,16 @@ class AuthViewSet(viewsets.ViewSet):
             # Update activity timestamp
             request.user.update_activity()
             
-            serializer = UserSerializer(request.user)
-            return Response({
-                'user': serializer.data,
-                'permissions': {
-                    'can_access_live_data': request.user.can_access_live_data,
-                    'can_modify_strategy': request.user.can_modify_strategy,
-                    'can_acknowledge_alerts': request.user.can_acknowledge_alerts,
+            cache_key = User.PAYLOAD_CACHE_KEY.format(request.user.id)
+            payload = cache.get(cache_key)
+            if payload is None:
+                user_data = UserSerializer(request.user).data
+                payload = {
+                    'user': user_data,
+                    'permissions': user_data['permissions']
                 }
-            })
+                cache.set(cache_key, payload, User.PAYLOAD_CACHE_TTL)
+            return Response(payload)
         
         return Response({
             'error': 'Not authenticated'
@@ -187,7 +234,24 @@ class AuthViewSet(viewsets.ViewSet):
         
         if serializer.is_valid():
             request.user.set_password(serializer.validated_data['new_password'])
-            request.user.save()
+            request.user.save(update_fields=['password'])
+            
+            # Other sessions now fail the password hash check; mark them closed
+            old_session_key = request.session.session_key
+            UserSession.objects.filter(
+                user=request.user,
+                is_active=True
+            ).exclude(
+                session_key=old_session_key
+            ).update(is_active=False)
+            
+            # Keep this session valid under the new hash. This cycles the
+            # session key, so carry the tracking row over to the new key
+            update_session_auth_hash(request, request.user)
+            UserSession.objects.filter(
+                user=request.user,
+                session_key=old_session_key
+            ).update(session_key=request.session.session_key)
             
             logger.info(f"User {request.user.username} changed password")
             
@@ -197,56 +261,31 @@ class AuthViewSet(viewsets.ViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    def _get_client_ip(self, request):
-        """Extract client IP address from request"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-    
     @action(detail=False, methods=['post'], url_path='register')
     def user_register(self, request):
         """Register a new user"""
-        from .serializers import UserSerializer
-        
-        # Create user with proper password handling
-        user_data = request.data.copy()
-        password = user_data.pop('password', None)
-        
-        serializer = UserSerializer(data=user_data)
+        # Password is write-only and hashed before the user is inserted
+        serializer = UserSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
             
-            # Set password properly
-            if password:
-                user.set_password(password)
-                user.save()
-            
-            # Auto-login after registration
-            if not request.session.session_key:
-                request.session.create()
-                
+            # Auto-login after registration (login() creates the session)
             login(request, user)
             
             # Create user session
             session = UserSession.objects.create(
                 user=user,
                 session_key=request.session.session_key,
-                ip_address=self._get_client_ip(request),
+                ip_address=_client_ip(request.META),
                 user_agent=request.META.get('HTTP_USER_AGENT', '')
             )
             
+            user_data = serializer.data
             return Response({
                 'message': 'User registered successfully',
-                'user': UserSerializer(user).data,
+                'user': user_data,
                 'session': UserSessionSerializer(session).data,
-                'permissions': {
-                    'can_access_live_data': user.can_access_live_data,
-                    'can_modify_strategy': user.can_modify_strategy,
-                    'can_acknowledge_alerts': user.can_acknowledge_alerts,
-                }
+                'permissions': user_data['permissions']
             }, status=status.HTTP_201_CREATED)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -272,10 +311,19 @@ class UserViewSet(viewsets.ModelViewSet):
     """
     User management (admin only)
     """
-    queryset = User.objects.all().order_by('-date_joined')
+    queryset = User.objects.defer('password').order_by('-date_joined')
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Listings only need the columns UserSerializer renders
+            queryset = queryset.only(
+                *UserSerializer.model_field_names(), 'is_active', 'date_joined'
+            )
+        return queryset
+    
     @action(detail=True, methods=['post'], url_path='deactivate')
     def deactivate_user(self, request, pk=None):
         """Deactivate a user account"""
@@ -293,14 +341,26 @@ class UserSessionViewSet(viewsets.ReadOnlyModelViewSet):
     """
     View user sessions (admin only)
     """
-    queryset = UserSession.objects.all().order_by('-login_time')
+    queryset = UserSession.objects.select_related('user').order_by('-login_time')
     serializer_class = UserSessionSerializer
     permission_classes = [permissions.IsAdminUser]
     
     @action(detail=False, methods=['get'], url_path='active')
     def active_sessions(self, request):
         """Get all active sessions"""
-        active_sessions = self.get_queryset().filter(is_active=True)
-        serializer = self.get_serializer(active_sessions, many=True)
-        return Response(serializer.data)
+        # Only load the columns UserSessionSerializer renders
+        session_fields = [field for field in UserSessionSerializer.Meta.fields if field != 'user']
+        user_fields = [f'user__{field}' for field in UserSerializer.model_field_names()]
+        active_sessions = self.get_queryset().filter(is_active=True).only(
+            *session_fields, *user_fields
+        )
+        
+        # Stream one JSON document per session instead of building the full list;
+        # rows are plain dicts, so no serializer is instantiated per session
+        session_row = _row_builder(UserSessionSerializer())
+        rows = (
+            orjson.dumps(session_row(session), option=orjson.OPT_UTC_Z) + b'\n'
+            for session in active_sessions.iterator(chunk_size=500)
+        )
+        return StreamingHttpResponse(rows, content_type='application/x-ndjson')
 
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alerts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['created_at'], name='alerts_aler_created_8af5ce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['is_active', 'is_acknowledged', '-severity', '-created_at'], name='alerts_aler_is_acti_dcf24b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['vehicle', 'alert_type', 'is_active', 'created_at'], name='alerts_aler_vehicle_f9f2b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['alert_type', 'is_active'], name='alerts_aler_alert_t_3344e6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='alert_active_ct_idx'),
+        ),
+    ]
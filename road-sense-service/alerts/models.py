@@ -1,7 +1,12 @@
 from django.db import models
+from django.db.models import Q
 from telemetry.models import Vehicle
 
 class Alert(models.Model):
+    # Cached dashboard summary, dropped when an alert is saved or deleted
+    SUMMARY_CACHE_KEY = 'alert_summary_v1'
+    SUMMARY_CACHE_TTL = 5
+    
     ALERT_TYPES = [
         ('TIRE_WEAR', 'Tire Wear'),
         ('FUEL_LOW', 'Low Fuel'),
@@ -29,8 +34,25 @@ class Alert(models.Model):
     is_acknowledged = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     acknowledged_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        indexes = [
+            # Chronological list/cursor, 24h summary window and cleanup cutoffs
+            models.Index(fields=['created_at']),
+            # active(): equality on the flags, then -severity, -created_at order
+            models.Index(fields=['is_active', 'is_acknowledged', '-severity', '-created_at']),
+            # check_conditions dedup and auto-acknowledge by (vehicle, type)
+            models.Index(fields=['vehicle', 'alert_type', 'is_active', 'created_at']),
+            # ?alert_type= / ?is_active= list filters without a vehicle
+            models.Index(fields=['alert_type', 'is_active']),
+            # Partial index for the active-alert listings
+            models.Index(fields=['-created_at'], name='alert_active_ct_idx', condition=Q(is_active=True)),
+        ]
 
 class AlertRule(models.Model):
+    # Cache key for the active rule list used by the periodic alert check
+    ACTIVE_RULES_CACHE_KEY = 'active_alert_rules'
+    
     name = models.CharField(max_length=100)
     alert_type = models.CharField(max_length=50, choices=Alert.ALERT_TYPES)
     condition = models.JSONField()  # Store condition logic
@@ -6,12 +6,21 @@ class AlertSerializer(serializers.ModelSerializer):
         model = Alert
         fields = '__all__'
 
+class AlertListSerializer(serializers.ModelSerializer):
+    """Lightweight alert representation for dashboard alert lists"""
+    class Meta:
+        model = Alert
+        fields = ['id', 'vehicle', 'alert_type', 'severity', 'title', 'message',
+                  'recommended_action', 'is_active', 'is_acknowledged', 'created_at']
+
 class AlertRuleSerializer(serializers.ModelSerializer):
     class Meta:
         model = AlertRule
         fields = '__all__'
 
 class AlertSummarySerializer(serializers.Serializer):
-    active_alerts = serializers.IntegerField()
-    high_severity_alerts = serializers.IntegerField()
-    recent_alerts = AlertSerializer(many=True)
\ No newline at end of file
+    """Dashboard alert summary; nested values arrive already serialized"""
+    statistics = serializers.JSONField(read_only=True)
+    distribution = serializers.JSONField(read_only=True)
+    recent_alerts = serializers.JSONField(read_only=True)
+    timestamp = serializers.CharField(read_only=True)
\ No newline at end of file
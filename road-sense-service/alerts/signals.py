@@ -0,0 +1,18 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Alert, AlertRule
+
+@receiver([post_save, post_delete], sender=AlertRule)
+def invalidate_active_rules_cache(sender, instance, **kwargs):
+    """
+    Drop the cached active rule list whenever a rule changes
+    """
+    cache.delete(AlertRule.ACTIVE_RULES_CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Alert)
+def invalidate_summary_cache(sender, instance, **kwargs):
+    """
+    Drop the cached dashboard summary whenever an alert changes
+    """
+    cache.delete(Alert.SUMMARY_CACHE_KEY)
@@ -1,164 +1,223 @@
+import asyncio
+import logging
 from celery import shared_task
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from .models import Alert, AlertRule
 from telemetry.models import TelemetryData
-from strategy.ml_integration import StrategyMLModels
+from strategy.ml_integration import get_ml_models, cached_tire_prediction
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 from datetime import timedelta
 
-@shared_task
+logger = logging.getLogger(__name__)
+
+@shared_task(ignore_result=True)
 def check_alert_conditions():
     """Check all alert conditions and generate new alerts"""
     try:
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         new_alerts = []
         
         # Get latest telemetry data
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
+        latest_telemetry = (
+            TelemetryData.objects
+            .select_related('vehicle')
+            .only('id', 'timestamp', 'vehicle', 'lap_number', 'position', 'gap_to_leader')
+            .order_by('-timestamp')
+            .first()
+        )
         
         if not latest_telemetry:
             return "No telemetry data available for alert checking"
         
-        # Check all active alert rules
-        active_rules = AlertRule.objects.filter(is_active=True)
+        # Check all active alert rules (cached, invalidated on rule changes)
+        active_rules = cache.get_or_set(
+            AlertRule.ACTIVE_RULES_CACHE_KEY,
+            lambda: list(AlertRule.objects.filter(is_active=True)),
+            60
+        )
+        
+        # Run each ML prediction at most once, and only if a rule needs it
+        predictions = {}
+        if any(rule.alert_type == 'TIRE_WEAR' for rule in active_rules):
+            predictions['tire'] = cached_tire_prediction(ml_models, latest_telemetry)
         
         for rule in active_rules:
-            alerts = _evaluate_alert_rule(rule, latest_telemetry, ml_models)
+            alerts = _evaluate_alert_rule(rule, latest_telemetry, predictions)
             new_alerts.extend(alerts)
         
-        # Save new alerts
-        saved_count = 0
-        for alert_data in new_alerts:
-            alert = Alert.objects.create(**alert_data)
-            saved_count += 1
-            
-            # Broadcast alert via WebSocket
-            _broadcast_alert(alert)
+        # Save new alerts in a single batched insert
+        with transaction.atomic():
+            created_alerts = Alert.objects.bulk_create(
+                [Alert(**alert_data) for alert_data in new_alerts],
+                batch_size=500
+            )
+        
+        # bulk_create skips post_save, so invalidate the summary here
+        if created_alerts:
+            cache.delete(Alert.SUMMARY_CACHE_KEY)
         
-        return f"Generated {saved_count} new alerts"
+        # Broadcast alerts via WebSocket
+        _broadcast_alerts(created_alerts)
+        
+        return f"Generated {len(created_alerts)} new alerts"
         
     except Exception as e:
         return f"Error checking alert conditions: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def cleanup_old_alerts(days_old=7):
     """Clean up old alerts that are no longer active"""
     try:
         cutoff_time = timezone.now() - timedelta(days=days_old)
-        deleted_count, _ = Alert.objects.filter(
+        old_alerts = Alert.objects.filter(
             created_at__lt=cutoff_time,
             is_active=False
-        ).delete()
+        )
+        
+        # Alert has no dependent rows, so issue a single DELETE instead of
+        # Django's collect-then-delete cascade. That skips the post_delete
+        # receiver, so drop the summary cache it would have invalidated
+        deleted_count = old_alerts._raw_delete(old_alerts.db)
+        if deleted_count:
+            cache.delete(Alert.SUMMARY_CACHE_KEY)
         
         return f"Cleaned up {deleted_count} old alerts"
         
     except Exception as e:
         return f"Error cleaning up alerts: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def acknowledge_stale_alerts(hours_old=2):
     """Automatically acknowledge alerts that have been active for too long"""
     try:
-        cutoff_time = timezone.now() - timedelta(hours=hours_old)
-        stale_alerts = Alert.objects.filter(
-            is_active=True,
-            is_acknowledged=False,
-            created_at__lt=cutoff_time
-        )
+        now = timezone.now()
+        cutoff_time = now - timedelta(hours=hours_old)
         
-        updated_count = stale_alerts.update(
-            is_acknowledged=True,
-            acknowledged_at=timezone.now()
-        )
+        with transaction.atomic():
+            updated_count = Alert.objects.filter(
+                is_active=True,
+                is_acknowledged=False,
+                created_at__lt=cutoff_time
+            ).update(
+                is_acknowledged=True,
+                acknowledged_at=now
+            )
+        if updated_count:
+            cache.delete(Alert.SUMMARY_CACHE_KEY)
         
         return f"Auto-acknowledged {updated_count} stale alerts"
         
     except Exception as e:
         return f"Error acknowledging stale alerts: {str(e)}"
 
-def _evaluate_alert_rule(rule, telemetry, ml_models):
+def _handle_tire_wear(rule, telemetry, predictions):
+    """Check tire wear conditions using the shared ML prediction"""
+    tire_prediction = predictions['tire']
+    grip_loss_rate = tire_prediction.get('grip_loss_rate', 0)
+    if grip_loss_rate <= 0.12:
+        return None
+    return {
+        'vehicle': telemetry.vehicle,
+        'alert_type': 'TIRE_WEAR',
+        'severity': rule.severity,
+        'title': 'High Tire Degradation',
+        'message': rule.message_template.format(
+            degradation_rate=grip_loss_rate
+        ),
+        'recommended_action': rule.action_template,
+        'triggered_by': {
+            'grip_loss_rate': grip_loss_rate,
+            'rule_id': rule.id
+        }
+    }
+
+def _handle_fuel_low(rule, telemetry, predictions):
+    """Check fuel conditions (simulated)"""
+    predicted_laps_remaining = 20 - (telemetry.lap_number % 20)
+    if predicted_laps_remaining >= 8:
+        return None
+    return {
+        'vehicle': telemetry.vehicle,
+        'alert_type': 'FUEL_LOW',
+        'severity': rule.severity,
+        'title': 'Low Fuel Warning',
+        'message': rule.message_template.format(
+            laps_remaining=predicted_laps_remaining
+        ),
+        'recommended_action': rule.action_template,
+        'triggered_by': {
+            'laps_remaining': predicted_laps_remaining,
+            'rule_id': rule.id
+        }
+    }
+
+def _handle_strategy_opportunity(rule, telemetry, predictions):
+    """Check for strategy opportunities"""
+    if not (telemetry.position in (2, 3, 4) and telemetry.gap_to_leader < 5.0):
+        return None
+    return {
+        'vehicle': telemetry.vehicle,
+        'alert_type': 'STRATEGY_OPPORTUNITY',
+        'severity': rule.severity,
+        'title': 'Strategy Opportunity',
+        'message': rule.message_template.format(
+            position=telemetry.position,
+            gap=telemetry.gap_to_leader
+        ),
+        'recommended_action': rule.action_template,
+        'triggered_by': {
+            'position': telemetry.position,
+            'gap_to_leader': telemetry.gap_to_leader,
+            'rule_id': rule.id
+        }
+    }
+
+# Rule alert type -> handler returning an alert dict or None
+_HANDLERS = {
+    'TIRE_WEAR': _handle_tire_wear,
+    'FUEL_LOW': _handle_fuel_low,
+    'STRATEGY_OPPORTUNITY': _handle_strategy_opportunity,
+}
+
+def _evaluate_alert_rule(rule, telemetry, predictions):
     """Evaluate a single alert rule against current telemetry"""
-    alerts = []
-    
-    if rule.alert_type == 'TIRE_WEAR':
-        # Check tire wear conditions using ML model
-        tire_prediction = ml_models.predict_tire_degradation(telemetry)
-        if tire_prediction.get('grip_loss_rate', 0) > 0.12:
-            alerts.append({
-                'vehicle': telemetry.vehicle,
-                'alert_type': 'TIRE_WEAR',
-                'severity': rule.severity,
-                'title': 'High Tire Degradation',
-                'message': rule.message_template.format(
-                    degradation_rate=tire_prediction['grip_loss_rate']
-                ),
-                'recommended_action': rule.action_template,
-                'triggered_by': {
-                    'grip_loss_rate': tire_prediction['grip_loss_rate'],
-                    'rule_id': rule.id
-                }
-            })
-    
-    elif rule.alert_type == 'FUEL_LOW':
-        # Check fuel conditions (simulated)
-        predicted_laps_remaining = 20 - (telemetry.lap_number % 20)
-        if predicted_laps_remaining < 8:
-            alerts.append({
-                'vehicle': telemetry.vehicle,
-                'alert_type': 'FUEL_LOW',
-                'severity': rule.severity,
-                'title': 'Low Fuel Warning',
-                'message': rule.message_template.format(
-                    laps_remaining=predicted_laps_remaining
-                ),
-                'recommended_action': rule.action_template,
-                'triggered_by': {
-                    'laps_remaining': predicted_laps_remaining,
-                    'rule_id': rule.id
-                }
-            })
-    
-    elif rule.alert_type == 'STRATEGY_OPPORTUNITY':
-        # Check for strategy opportunities
-        if telemetry.position in [2, 3, 4] and telemetry.gap_to_leader < 5.0:
-            alerts.append({
-                'vehicle': telemetry.vehicle,
-                'alert_type': 'STRATEGY_OPPORTUNITY',
-                'severity': rule.severity,
-                'title': 'Strategy Opportunity',
-                'message': rule.message_template.format(
-                    position=telemetry.position,
-                    gap=telemetry.gap_to_leader
-                ),
-                'recommended_action': rule.action_template,
-                'triggered_by': {
-                    'position': telemetry.position,
-                    'gap_to_leader': telemetry.gap_to_leader,
-                    'rule_id': rule.id
-                }
-            })
-    
-    return alerts
+    handler = _HANDLERS.get(rule.alert_type)
+    if handler is None:
+        return []
+    alert = handler(rule, telemetry, predictions)
+    return [alert] if alert else []
 
-def _broadcast_alert(alert):
-    """Broadcast alert to WebSocket clients"""
+def _alert_message(alert):
+    """Build the WebSocket payload for a single alert"""
+    return {
+        'type': 'alert_update',
+        'data': {
+            'id': alert.id,
+            'type': alert.alert_type,
+            'severity': alert.severity,
+            'title': alert.title,
+            'message': alert.message,
+            'action': alert.recommended_action,
+            'timestamp': alert.created_at.isoformat()
+        }
+    }
+
+async def _broadcast_many(alerts):
+    """Send all alert updates concurrently on one event loop"""
+    channel_layer = get_channel_layer()
+    await asyncio.gather(*[
+        channel_layer.group_send('alert_updates', _alert_message(alert))
+        for alert in alerts
+    ])
+
+def _broadcast_alerts(alerts):
+    """Broadcast alerts to WebSocket clients"""
+    if not alerts:
+        return
     try:
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            'alert_updates',
-            {
-                'type': 'alert_update',
-                'data': {
-                    'id': alert.id,
-                    'type': alert.alert_type,
-                    'severity': alert.severity,
-                    'title': alert.title,
-                    'message': alert.message,
-                    'action': alert.recommended_action,
-                    'timestamp': alert.created_at.isoformat()
-                }
-            }
-        )
-    except Exception as e:
-        print(f"Error broadcasting alert: {e}")
\ No newline at end of file
+        async_to_sync(_broadcast_many)(alerts)
+    except Exception:
+        logger.exception("Error broadcasting alerts")
@@ -1,3 +1,132 @@
-from django.test import TestCase
+from datetime import timedelta
+from django.core.cache import cache
+from unittest import mock
+from django.test import TestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
 
-# Create your tests here.
+from telemetry.models import TelemetryData, Vehicle
+from .models import Alert
+from .views import CHECK_CONDITIONS_CACHE_KEY, CHECK_CONDITIONS_PENDING
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def create_alert(severity, minutes_ago, **kwargs):
+    """Create an alert with a given age; created_at is auto_now_add"""
+    alert = Alert.objects.create(
+        alert_type='TIRE_WEAR',
+        severity=severity,
+        title=f'{severity} alert',
+        message='Test alert',
+        triggered_by={},
+        **kwargs
+    )
+    Alert.objects.filter(pk=alert.pk).update(created_at=timezone.now() - timedelta(minutes=minutes_ago))
+    return alert
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AlertPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for minutes_ago, severity in enumerate(['LOW', 'CRITICAL', 'MEDIUM', 'HIGH', 'CRITICAL']):
+            create_alert(severity, minutes_ago)
+        create_alert('HIGH', 10, is_acknowledged=True)
+    
+    def test_list_pages_by_cursor_newest_first(self):
+        response = self.client.get('/api/alerts/alerts/', {'page_size': 4})
+        self.assertEqual(response.status_code, 200)
+        first_page = response.json()
+        self.assertNotIn('count', first_page)
+        self.assertIsNotNone(first_page['next'])
+        
+        second_page = self.client.get(first_page['next']).json()
+        ids = [alert['id'] for alert in first_page['results'] + second_page['results']]
+        
+        expected = list(Alert.objects.order_by('-created_at').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+    
+    def test_active_keeps_severity_first_ordering(self):
+        response = self.client.get('/api/alerts/alerts/active/')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        
+        expected = list(
+            Alert.objects.filter(is_active=True, is_acknowledged=False)
+            .order_by('-severity', '-created_at')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(body['count'], len(expected))
+        self.assertEqual([alert['id'] for alert in body['results']], expected)
+
+
+class CheckConditionsMixin:
+    url = '/api/alerts/alerts/check-conditions/'
+    
+    def setUp(self):
+        cache.clear()
+        self.vehicle = Vehicle.objects.create(number=7, team='Team 7', driver='Driver 7', vehicle_id='GR86-007-000')
+    
+    def create_telemetry(self, lap_number):
+        telemetry = TelemetryData.objects.create(
+            vehicle=self.vehicle,
+            lap_number=lap_number,
+            lap_time=timedelta(seconds=85),
+            speed=180.0,
+            rpm=11000,
+            gear=5,
+            throttle=90.0,
+            brake=0.0,
+            position=2,
+            gap_to_leader=1.5,
+        )
+        # The post_save handler records the newest id on commit, which
+        # TestCase never reaches
+        cache.set(TelemetryData.LATEST_ID_CACHE_KEY, telemetry.id, timeout=None)
+        return telemetry
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CheckConditionsPendingTests(CheckConditionsMixin, TestCase):
+    def test_concurrent_check_is_reported_in_progress(self):
+        telemetry = self.create_telemetry(1)
+        cache.set(CHECK_CONDITIONS_CACHE_KEY.format(telemetry.id), CHECK_CONDITIONS_PENDING)
+        
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 202)
+        self.assertNotIn('alerts_generated', response.json())
+        self.assertFalse(Alert.objects.exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+@skipUnlessDBFeature('can_distinct_on_fields')
+class CheckConditionsCacheTests(CheckConditionsMixin, TestCase):
+    def test_repeated_check_returns_the_first_response(self):
+        self.create_telemetry(1)
+        
+        first = self.client.post(self.url)
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(first.json()['alerts_generated'], Alert.objects.count())
+        alert_count = Alert.objects.count()
+        
+        second = self.client.post(self.url)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(Alert.objects.count(), alert_count)
+    
+    def test_new_telemetry_is_checked_again(self):
+        self.create_telemetry(1)
+        self.client.post(self.url)
+        
+        newest = self.create_telemetry(2)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(cache.get(CHECK_CONDITIONS_CACHE_KEY.format(newest.id)), response.json())
+    
+    def test_failed_check_releases_the_claim(self):
+        telemetry = self.create_telemetry(1)
+        
+        with mock.patch('alerts.views.AlertViewSet._check_tire_conditions', side_effect=RuntimeError):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 500)
+        self.assertIsNone(cache.get(CHECK_CONDITIONS_CACHE_KEY.format(telemetry.id)))
@@ -1,18 +1,81 @@
 from rest_framework import viewsets, status, mixins
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 from rest_framework.throttling import UserRateThrottle
 from django.utils import timezone
+from django.core.cache import cache
 from datetime import timedelta
-from django.db.models import Q, Count
+import logging
+import numpy as np
+from django.db.models import Q, Count, Avg
+from django.db.models.functions import Now
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 
 from .models import Alert, AlertRule
-from .serializers import AlertSerializer, AlertRuleSerializer, AlertSummarySerializer
+from .serializers import AlertSerializer, AlertListSerializer, AlertRuleSerializer, AlertSummarySerializer
 from telemetry.models import TelemetryData
-from strategy.ml_integration import StrategyMLModels
+from strategy.ml_integration import get_ml_models, cached_tire_predictions
+
+logger = logging.getLogger(__name__)
+
+# Positions close enough behind to attempt an undercut
+_UNDERCUT_POSITIONS = frozenset({2, 3, 4})
+
+# Next severity level for escalate(); CRITICAL cannot be escalated further
+_NEXT_SEVERITY = {'LOW': 'MEDIUM', 'MEDIUM': 'HIGH', 'HIGH': 'CRITICAL', 'CRITICAL': None}
+
+# Response of check_conditions for a given latest telemetry id; holds
+# CHECK_CONDITIONS_PENDING while the first caller is still evaluating
+CHECK_CONDITIONS_CACHE_KEY = 'alerts:check:{}'
+CHECK_CONDITIONS_CACHE_TTL = 60
+CHECK_CONDITIONS_PENDING = 'pending'
+
+# Tire tiers ascending by grip loss rate (s/lap); a tier fires above its threshold
+TIRE_THRESHOLDS = (
+    (0.10, 'MEDIUM', 'Moderate Tire Degradation',
+     'Moderate tire degradation: {rate:.3f}s per lap',
+     'Monitor tire performance closely'),
+    (0.15, 'HIGH', 'High Tire Degradation',
+     'High tire degradation: {rate:.3f}s per lap. {laps} laps remaining.',
+     'Plan pit stop within 2-3 laps'),
+    (0.20, 'CRITICAL', 'Critical Tire Degradation',
+     'Extreme tire degradation: {rate:.3f}s per lap. Only {laps} laps remaining.',
+     'Immediate pit stop required'),
+)
+TIRE_THRESHOLD_VALUES = np.array([tier[0] for tier in TIRE_THRESHOLDS])
+
+# Fuel tiers ascending by laps remaining; a tier fires below its threshold
+FUEL_THRESHOLDS = (
+    (3, 'CRITICAL', 'Critical Fuel Level',
+     'CRITICAL: Only {laps} laps of fuel remaining',
+     'PIT THIS LAP - Fuel saving impossible'),
+    (5, 'HIGH', 'Very Low Fuel',
+     'Only {laps} laps of fuel remaining',
+     'Pit within 2 laps or implement extreme fuel saving'),
+    (8, 'MEDIUM', 'Low Fuel Warning',
+     'Low fuel: {laps} laps remaining',
+     'Plan pit stop and consider fuel saving measures'),
+)
+FUEL_THRESHOLD_VALUES = np.array([tier[0] for tier in FUEL_THRESHOLDS])
+
+def _tier_templates(alert_type, thresholds):
+    """
+    Prebuild the constant part of each tier's alert payload
+    """
+    return [
+        {
+            'alert_type': alert_type,
+            'severity': severity,
+            'title': title,
+            'recommended_action': action,
+        }
+        for _, severity, title, _, action in thresholds
+    ]
+
+_TIRE_TEMPLATES = _tier_templates('TIRE_WEAR', TIRE_THRESHOLDS)
+_FUEL_TEMPLATES = _tier_templates('FUEL_LOW', FUEL_THRESHOLDS)
 
 # Custom pagination for alerts
 class AlertPagination(PageNumberPagination):
@@ -20,6 +83,13 @@ class AlertPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+# Keyset pagination for -created_at ordered alert lists (no COUNT per page)
+class AlertCursorPagination(CursorPagination):
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
 # Custom throttling for alert checking
 class AlertCheckThrottle(UserRateThrottle):
     rate = '10/minute'  # Limit to 10 checks per minute per user
@@ -28,18 +98,23 @@ class AlertViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing racing alerts with intelligent detection and ML integration.
     """
-    queryset = Alert.objects.all().order_by('-created_at')
+    queryset = Alert.objects.select_related('vehicle').order_by('-created_at')
     serializer_class = AlertSerializer
-    pagination_class = AlertPagination
+    pagination_class = AlertCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['alert_type', 'severity', 'is_active', 'is_acknowledged']
     search_fields = ['title', 'message']
     
+    # Single-object actions look alerts up by pk and skip list filtering
+    DETAIL_ACTIONS = ('retrieve', 'update', 'partial_update', 'destroy', 'acknowledge', 'escalate')
+    
     def get_queryset(self):
         """
         Enhanced queryset with advanced filtering capabilities
         """
         queryset = super().get_queryset()
+        if self.action in self.DETAIL_ACTIONS:
+            return queryset
         
         # Filter by active alerts
         active_only = self.request.query_params.get('active')
@@ -51,10 +126,11 @@ class AlertViewSet(viewsets.ModelViewSet):
         if severity:
             queryset = queryset.filter(severity=severity.upper())
         
-        # Filter by time range (last 24 hours by default)
-        hours = int(self.request.query_params.get('hours', 24))
-        time_threshold = timezone.now() - timedelta(hours=hours)
-        queryset = queryset.filter(created_at__gte=time_threshold)
+        # Filter by time range when requested
+        hours = self.request.query_params.get('hours')
+        if hours:
+            time_threshold = timezone.now() - timedelta(hours=int(hours))
+            queryset = queryset.filter(created_at__gte=time_threshold)
         
         # Filter by vehicle if specified
         vehicle_id = self.request.query_params.get('vehicle_id')
@@ -63,14 +139,33 @@ class AlertViewSet(viewsets.ModelViewSet):
         
         return queryset
     
+    @property
+    def paginator(self):
+        """
+        Keyset pagination for the chronological list; active() keeps its
+        severity-first ordering, which cursors cannot page, so it pages by number
+        """
+        if not hasattr(self, '_paginator'):
+            self._paginator = AlertPagination() if self.action == 'active' else self.pagination_class()
+        return self._paginator
+    
+    def get_serializer_class(self):
+        if self.action == 'active':
+            return AlertListSerializer
+        return super().get_serializer_class()
+    
     @action(detail=False, methods=['get'], url_path='active')
     def active(self, request):
         """
         Get all active, unacknowledged alerts for immediate attention
         """
+        # Only load the columns AlertListSerializer renders; vehicle is
+        # rendered by pk, so the vehicle join is not needed here
         active_alerts = self.get_queryset().filter(
             is_active=True, 
             is_acknowledged=False
+        ).select_related(None).only(
+            *AlertListSerializer.Meta.fields
         ).order_by('-severity', '-created_at')
         
         page = self.paginate_queryset(active_alerts)
@@ -96,10 +191,10 @@ class AlertViewSet(viewsets.ModelViewSet):
         
         alert.is_acknowledged = True
         alert.acknowledged_at = timezone.now()
-        alert.save()
+        alert.save(update_fields=['is_acknowledged', 'acknowledged_at'])
         
         # Log the acknowledgment
-        print(f"Alert {alert.id} acknowledged by user at {alert.acknowledged_at}")
+        logger.debug("Alert %s acknowledged by user at %s", alert.id, alert.acknowledged_at)
         
         serializer = self.get_serializer(alert)
         return Response(serializer.data)
@@ -111,12 +206,11 @@ class AlertViewSet(viewsets.ModelViewSet):
         """
         alert = self.get_object()
         
-        severity_order = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
-        current_index = severity_order.index(alert.severity)
+        next_severity = _NEXT_SEVERITY.get(alert.severity)
         
-        if current_index < len(severity_order) - 1:
-            alert.severity = severity_order[current_index + 1]
-            alert.save()
+        if next_severity:
+            alert.severity = next_severity
+            alert.save(update_fields=['severity'])
             
             serializer = self.get_serializer(alert)
             return Response({
@@ -134,114 +228,177 @@ class AlertViewSet(viewsets.ModelViewSet):
         """
         Check all alert conditions and generate new alerts using ML models
         Throttled to prevent abuse
+        
+        Runs once per latest telemetry row: 201 with the generated alerts for
+        the first caller, 200 with that same payload for repeat callers, and
+        202 while the first caller is still evaluating.
         """
-        ml_models = StrategyMLModels()
+        # Newest telemetry id, from the sentinel kept by the telemetry writers
+        latest_telemetry_id = cache.get(TelemetryData.LATEST_ID_CACHE_KEY)
+        if latest_telemetry_id is None:
+            latest_telemetry_id = TelemetryData.objects.order_by('-timestamp').values_list(
+                'id', flat=True
+            ).first()
+            
+            if latest_telemetry_id is None:
+                return Response(
+                    {'error': 'No telemetry data available for alert checking'}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            cache.set(TelemetryData.LATEST_ID_CACHE_KEY, latest_telemetry_id, timeout=None)
+        
+        # Claim this telemetry id so only one caller runs the pipeline for it;
+        # later callers get the stored response
+        cache_key = CHECK_CONDITIONS_CACHE_KEY.format(latest_telemetry_id)
+        if not cache.add(cache_key, CHECK_CONDITIONS_PENDING, timeout=CHECK_CONDITIONS_CACHE_TTL):
+            cached = cache.get(cache_key)
+            if cached is None or cached == CHECK_CONDITIONS_PENDING:
+                return Response(
+                    {
+                        'message': 'Alert check for the latest telemetry is in progress',
+                        'timestamp': timezone.now().isoformat()
+                    },
+                    status=status.HTTP_202_ACCEPTED
+                )
+            return Response(cached)
+        
+        ml_models = get_ml_models()
         new_alerts = []
         
-        # Get latest telemetry data for all vehicles
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
-        
-        if not latest_telemetry:
-            return Response(
-                {'error': 'No telemetry data available for alert checking'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Latest telemetry row of every vehicle in one query (DISTINCT ON);
+        # alerts reference vehicles by vehicle_id, so no join is needed
+        latest_rows = list(TelemetryData.objects.latest_per_vehicle())
         
         # Check all alert conditions
         try:
-            # Tire condition checks
-            tire_alerts = self._check_tire_conditions(latest_telemetry, ml_models)
-            new_alerts.extend(tire_alerts)
-            
-            # Fuel condition checks
-            fuel_alerts = self._check_fuel_conditions(latest_telemetry, ml_models)
-            new_alerts.extend(fuel_alerts)
-            
-            # Strategy condition checks
-            strategy_alerts = self._check_strategy_conditions(latest_telemetry, ml_models)
-            new_alerts.extend(strategy_alerts)
+            # Tire and fuel condition checks, vectorized across vehicles
+            new_alerts.extend(self._check_tire_conditions(latest_rows, ml_models))
+            new_alerts.extend(self._check_fuel_conditions(latest_rows, ml_models))
             
-            # Weather condition checks
-            weather_alerts = self._check_weather_conditions(latest_telemetry, ml_models)
-            new_alerts.extend(weather_alerts)
+            # Recent lap time averages for every vehicle in one grouped query
+            recent_lap_stats = self._recent_lap_stats(
+                [telemetry.vehicle_id for telemetry in latest_rows]
+            )
             
-            # Performance condition checks
-            performance_alerts = self._check_performance_conditions(latest_telemetry, ml_models)
-            new_alerts.extend(performance_alerts)
+            for telemetry in latest_rows:
+                # Strategy condition checks
+                strategy_alerts = self._check_strategy_conditions(telemetry, ml_models)
+                new_alerts.extend(strategy_alerts)
+                
+                # Weather condition checks
+                weather_alerts = self._check_weather_conditions(telemetry, ml_models)
+                new_alerts.extend(weather_alerts)
+                
+                # Performance condition checks
+                performance_alerts = self._check_performance_conditions(
+                    telemetry, recent_lap_stats.get(telemetry.vehicle_id)
+                )
+                new_alerts.extend(performance_alerts)
             
         except Exception as e:
+            cache.delete(cache_key)
             return Response(
                 {'error': f'Alert condition checking failed: {str(e)}'}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
-        # Save new alerts and prevent duplicates
-        saved_alerts = []
+        # Save new alerts and prevent duplicates with one lookup and one insert
+        now = timezone.now()
+        dedup_cutoff = now - timedelta(minutes=30)  # Last 30 minutes
+        candidate_pairs = {
+            (alert_data['vehicle_id'], alert_data['alert_type'])
+            for alert_data in new_alerts
+        }
+        existing_pairs = set()
+        if candidate_pairs:
+            existing_pairs = set(
+                Alert.objects.filter(
+                    self._alert_pairs_filter(candidate_pairs),
+                    is_active=True,
+                    created_at__gte=dedup_cutoff
+                ).values_list('vehicle_id', 'alert_type')
+            )
+        
+        alerts_to_create = []
         for alert_data in new_alerts:
-            # Check if similar alert already exists
-            existing_alert = Alert.objects.filter(
-                vehicle=alert_data.get('vehicle'),
-                alert_type=alert_data['alert_type'],
-                is_active=True,
-                created_at__gte=timezone.now() - timedelta(minutes=30)  # Last 30 minutes
-            ).first()
-            
-            if not existing_alert:
-                alert = Alert.objects.create(**alert_data)
-                saved_alerts.append(alert)
+            pair = (alert_data['vehicle_id'], alert_data['alert_type'])
+            if pair in existing_pairs:
+                continue
+            existing_pairs.add(pair)
+            alerts_to_create.append(Alert(**alert_data))
+        
+        saved_alerts = Alert.objects.bulk_create(alerts_to_create, batch_size=500)
+        cache.delete(Alert.SUMMARY_CACHE_KEY)
         
         # Auto-acknowledge old alerts of the same type for the same vehicle
-        self._cleanup_old_alerts(saved_alerts)
+        self._cleanup_old_alerts(saved_alerts, dedup_cutoff)
         
         serializer = self.get_serializer(saved_alerts, many=True)
         
-        return Response({
+        response_data = {
             'message': f'Generated {len(saved_alerts)} new alerts',
             'alerts_generated': len(saved_alerts),
             'alerts': serializer.data,
             'timestamp': timezone.now().isoformat()
-        }, status=status.HTTP_201_CREATED)
+        }
+        cache.set(cache_key, response_data, timeout=CHECK_CONDITIONS_CACHE_TTL)
+        
+        return Response(response_data, status=status.HTTP_201_CREATED)
     
     @action(detail=False, methods=['get'], url_path='summary')
     def summary(self, request):
         """
         Get comprehensive alert summary for dashboard display
         """
+        # Polled by the dashboard every few seconds; share one build across callers
+        summary_data = cache.get_or_set(
+            Alert.SUMMARY_CACHE_KEY, self._build_summary, Alert.SUMMARY_CACHE_TTL
+        )
+        return Response(summary_data)
+    
+    def _build_summary(self):
+        """
+        Serialized alert summary for the last 24 hours
+        """
         # Base queryset for summary data
         base_queryset = Alert.objects.filter(
             created_at__gte=timezone.now() - timedelta(hours=24)
         )
         
-        # Calculate summary statistics
-        active_alerts = base_queryset.filter(is_active=True)
-        high_severity_alerts = active_alerts.filter(severity__in=['HIGH', 'CRITICAL'])
-        unacknowledged_alerts = active_alerts.filter(is_acknowledged=False)
+        # Calculate summary statistics in a single conditional aggregate
+        statistics = base_queryset.aggregate(
+            total_active_alerts=Count('id', filter=Q(is_active=True)),
+            high_severity_alerts=Count(
+                'id', filter=Q(is_active=True, severity__in=['HIGH', 'CRITICAL'])
+            ),
+            unacknowledged_alerts=Count('id', filter=Q(is_active=True, is_acknowledged=False)),
+            alerts_last_24h=Count('id'),
+        )
         
-        # Alert type distribution
-        alert_type_distribution = (
+        # Alert type distribution, one GROUP BY streamed without the queryset cache
+        alert_type_distribution = list(
             base_queryset
             .values('alert_type')
             .annotate(count=Count('id'))
             .order_by('-count')
+            .iterator(chunk_size=50)
         )
         
-        # Recent alerts for display
-        recent_alerts = base_queryset.order_by('-created_at')[:10]
+        # Recent alerts for display, limited to the list columns
+        recent_alerts = list(base_queryset.only(
+            *AlertListSerializer.Meta.fields
+        ).order_by('-created_at')[:10])
         
         summary_data = {
-            'statistics': {
-                'total_active_alerts': active_alerts.count(),
-                'high_severity_alerts': high_severity_alerts.count(),
-                'unacknowledged_alerts': unacknowledged_alerts.count(),
-                'alerts_last_24h': base_queryset.count(),
-            },
-            'distribution': list(alert_type_distribution),
-            'recent_alerts': AlertSerializer(recent_alerts, many=True).data,
+            'statistics': statistics,
+            'distribution': alert_type_distribution,
+            'recent_alerts': AlertListSerializer(
+                recent_alerts, many=True, context=self.get_serializer_context()
+            ).data,
             'timestamp': timezone.now().isoformat()
         }
         
-        serializer = AlertSummarySerializer(summary_data)
-        return Response(serializer.data)
+        return AlertSummarySerializer(summary_data).data
     
     @action(detail=False, methods=['post'], url_path='bulk-acknowledge')
     def bulk_acknowledge(self, request):
@@ -260,123 +417,81 @@ class AlertViewSet(viewsets.ModelViewSet):
             is_active=True
         ).update(
             is_acknowledged=True,
-            acknowledged_at=timezone.now()
+            acknowledged_at=Now()
         )
+        cache.delete(Alert.SUMMARY_CACHE_KEY)
         
         return Response({
             'message': f'Successfully acknowledged {updated_count} alerts',
             'alerts_acknowledged': updated_count
         })
     
-    def _check_tire_conditions(self, telemetry, ml_models):
-        """Enhanced tire condition checking with multiple thresholds"""
+    def _check_tire_conditions(self, telemetry_rows, ml_models):
+        """Tire condition checking for a batch of vehicles with multiple thresholds"""
         alerts = []
         
         try:
-            # Use ML model to predict tire degradation
-            tire_prediction = ml_models.predict_tire_degradation(telemetry)
-            grip_loss_rate = tire_prediction.get('grip_loss_rate', 0)
-            predicted_laps = tire_prediction.get('predicted_laps_remaining', 20)
+            # Use ML model to predict tire degradation for every row at once
+            predictions = cached_tire_predictions(ml_models, telemetry_rows)
+            grip_loss_rates = np.fromiter(
+                (prediction.get('grip_loss_rate', 0) for prediction in predictions),
+                dtype=float, count=len(predictions)
+            )
             
-            # Multiple severity levels based on degradation rate
-            if grip_loss_rate > 0.20:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'TIRE_WEAR',
-                    'severity': 'CRITICAL',
-                    'title': 'Critical Tire Degradation',
-                    'message': f'Extreme tire degradation: {grip_loss_rate:.3f}s per lap. Only {predicted_laps} laps remaining.',
-                    'recommended_action': 'Immediate pit stop required',
-                    'triggered_by': {
-                        'grip_loss_rate': grip_loss_rate,
-                        'predicted_laps_remaining': predicted_laps,
-                        'threshold': 0.20
-                    }
-                })
-            elif grip_loss_rate > 0.15:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'TIRE_WEAR',
-                    'severity': 'HIGH',
-                    'title': 'High Tire Degradation',
-                    'message': f'High tire degradation: {grip_loss_rate:.3f}s per lap. {predicted_laps} laps remaining.',
-                    'recommended_action': 'Plan pit stop within 2-3 laps',
-                    'triggered_by': {
-                        'grip_loss_rate': grip_loss_rate,
-                        'predicted_laps_remaining': predicted_laps,
-                        'threshold': 0.15
-                    }
-                })
-            elif grip_loss_rate > 0.10:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'TIRE_WEAR', 
-                    'severity': 'MEDIUM',
-                    'title': 'Moderate Tire Degradation',
-                    'message': f'Moderate tire degradation: {grip_loss_rate:.3f}s per lap',
-                    'recommended_action': 'Monitor tire performance closely',
-                    'triggered_by': {
+            # Highest tier whose threshold each degradation rate exceeds
+            tiers = np.digitize(grip_loss_rates, TIRE_THRESHOLD_VALUES, right=True) - 1
+            for i in np.flatnonzero(tiers >= 0):
+                telemetry = telemetry_rows[i]
+                idx = int(tiers[i])
+                grip_loss_rate = predictions[i].get('grip_loss_rate', 0)
+                predicted_laps = predictions[i].get('predicted_laps_remaining', 20)
+                values = {'rate': grip_loss_rate, 'laps': predicted_laps}
+                alert = _TIRE_TEMPLATES[idx].copy()
+                alert.update(
+                    vehicle_id=telemetry.vehicle_id,
+                    message=TIRE_THRESHOLDS[idx][3].format_map(values),
+                    triggered_by={
                         'grip_loss_rate': grip_loss_rate,
                         'predicted_laps_remaining': predicted_laps,
-                        'threshold': 0.10
+                        'threshold': TIRE_THRESHOLDS[idx][0]
                     }
-                })
+                )
+                alerts.append(alert)
                 
-        except Exception as e:
-            print(f"Tire condition check failed: {e}")
+        except Exception:
+            logger.exception("Tire condition check failed")
             
         return alerts
     
-    def _check_fuel_conditions(self, telemetry, ml_models):
-        """Enhanced fuel condition checking with multiple thresholds"""
+    def _check_fuel_conditions(self, telemetry_rows, ml_models):
+        """Fuel condition checking for a batch of vehicles with multiple thresholds"""
         alerts = []
         
         try:
             # Simulate fuel calculation (would use your fuel model)
-            predicted_laps_remaining = 18 - (telemetry.lap_number % 20)  # Simulated
+            laps_remaining = np.fromiter(
+                (18 - (telemetry.lap_number % 20) for telemetry in telemetry_rows),  # Simulated
+                dtype=int, count=len(telemetry_rows)
+            )
             
-            if predicted_laps_remaining < 3:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'FUEL_LOW',
-                    'severity': 'CRITICAL',
-                    'title': 'Critical Fuel Level',
-                    'message': f'CRITICAL: Only {predicted_laps_remaining} laps of fuel remaining',
-                    'recommended_action': 'PIT THIS LAP - Fuel saving impossible',
-                    'triggered_by': {
-                        'laps_remaining': predicted_laps_remaining,
-                        'threshold': 3
-                    }
-                })
-            elif predicted_laps_remaining < 5:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'FUEL_LOW', 
-                    'severity': 'HIGH',
-                    'title': 'Very Low Fuel',
-                    'message': f'Only {predicted_laps_remaining} laps of fuel remaining',
-                    'recommended_action': 'Pit within 2 laps or implement extreme fuel saving',
-                    'triggered_by': {
-                        'laps_remaining': predicted_laps_remaining,
-                        'threshold': 5
-                    }
-                })
-            elif predicted_laps_remaining < 8:
-                alerts.append({
-                    'vehicle': telemetry.vehicle,
-                    'alert_type': 'FUEL_LOW',
-                    'severity': 'MEDIUM', 
-                    'title': 'Low Fuel Warning',
-                    'message': f'Low fuel: {predicted_laps_remaining} laps remaining',
-                    'recommended_action': 'Plan pit stop and consider fuel saving measures',
-                    'triggered_by': {
+            # Lowest tier whose threshold each remaining lap count falls below
+            tiers = np.digitize(laps_remaining, FUEL_THRESHOLD_VALUES)
+            for i in np.flatnonzero(tiers < len(FUEL_THRESHOLDS)):
+                idx = int(tiers[i])
+                predicted_laps_remaining = int(laps_remaining[i])
+                alert = _FUEL_TEMPLATES[idx].copy()
+                alert.update(
+                    vehicle_id=telemetry_rows[i].vehicle_id,
+                    message=FUEL_THRESHOLDS[idx][3].format_map({'laps': predicted_laps_remaining}),
+                    triggered_by={
                         'laps_remaining': predicted_laps_remaining,
-                        'threshold': 8
+                        'threshold': FUEL_THRESHOLDS[idx][0]
                     }
-                })
+                )
+                alerts.append(alert)
                 
-        except Exception as e:
-            print(f"Fuel condition check failed: {e}")
+        except Exception:
+            logger.exception("Fuel condition check failed")
             
         return alerts
     
@@ -386,9 +501,11 @@ class AlertViewSet(viewsets.ModelViewSet):
         
         try:
             # Check for undercut opportunities (pitting before competitor)
-            if telemetry.position in [2, 3, 4] and telemetry.gap_to_leader < 3.0:
+            gap_to_leader = telemetry.gap_to_leader
+            if (telemetry.position in _UNDERCUT_POSITIONS
+                    and gap_to_leader is not None and gap_to_leader < 3.0):
                 alerts.append({
-                    'vehicle': telemetry.vehicle,
+                    'vehicle_id': telemetry.vehicle_id,
                     'alert_type': 'STRATEGY_OPPORTUNITY',
                     'severity': 'HIGH',
                     'title': 'Undercut Opportunity',
@@ -405,7 +522,7 @@ class AlertViewSet(viewsets.ModelViewSet):
             if telemetry.position == 1 and telemetry.gap_to_leader == 0:
                 # Leader can control pace and overcut
                 alerts.append({
-                    'vehicle': telemetry.vehicle,
+                    'vehicle_id': telemetry.vehicle_id,
                     'alert_type': 'STRATEGY_OPPORTUNITY', 
                     'severity': 'MEDIUM',
                     'title': 'Overcut Opportunity Available',
@@ -417,8 +534,8 @@ class AlertViewSet(viewsets.ModelViewSet):
                     }
                 })
                 
-        except Exception as e:
-            print(f"Strategy condition check failed: {e}")
+        except Exception:
+            logger.exception("Strategy condition check failed")
             
         return alerts
     
@@ -429,23 +546,34 @@ class AlertViewSet(viewsets.ModelViewSet):
         # Placeholder for weather alert logic
         return alerts
     
-    def _check_performance_conditions(self, telemetry, ml_models):
-        """Performance anomaly detection"""
+    @staticmethod
+    def _recent_lap_stats(vehicle_ids, laps=5):
+        """
+        Average lap time and lap count over each vehicle's last `laps` rows,
+        keyed by vehicle_id
+        """
+        recent_ids = TelemetryData.objects.filter(
+            vehicle_id__in=vehicle_ids
+        ).recent_per_vehicle(laps).values('id')
+        
+        stats = TelemetryData.objects.filter(id__in=recent_ids).values('vehicle_id').annotate(
+            avg_lap_time=Avg('lap_time'), lap_count=Count('id')
+        ).order_by()
+        return {row['vehicle_id']: row for row in stats}
+    
+    def _check_performance_conditions(self, telemetry, recent_laps):
+        """Performance anomaly detection against precomputed recent lap stats"""
         alerts = []
         
         try:
             # Check for significant lap time drop-off
-            recent_laps = TelemetryData.objects.filter(
-                vehicle=telemetry.vehicle
-            ).order_by('-timestamp')[:5]
-            
-            if len(recent_laps) >= 3:
-                avg_recent_time = sum(lap.lap_time.total_seconds() for lap in recent_laps) / len(recent_laps)
+            if recent_laps and recent_laps['lap_count'] >= 3:
+                avg_recent_time = recent_laps['avg_lap_time'].total_seconds()
                 current_time = telemetry.lap_time.total_seconds()
                 
                 if current_time > avg_recent_time + 1.0:  # 1+ second slower
                     alerts.append({
-                        'vehicle': telemetry.vehicle,
+                        'vehicle_id': telemetry.vehicle_id,
                         'alert_type': 'PERFORMANCE_DROP',
                         'severity': 'MEDIUM',
                         'title': 'Performance Drop Detected',
@@ -458,25 +586,36 @@ class AlertViewSet(viewsets.ModelViewSet):
                         }
                     })
                     
-        except Exception as e:
-            print(f"Performance condition check failed: {e}")
+        except Exception:
+            logger.exception("Performance condition check failed")
             
         return alerts
     
-    def _cleanup_old_alerts(self, new_alerts):
+    @staticmethod
+    def _alert_pairs_filter(pairs):
+        """
+        Build a Q matching any of the given (vehicle_id, alert_type) pairs
+        """
+        condition = Q()
+        for vehicle_id, alert_type in pairs:
+            condition |= Q(vehicle_id=vehicle_id, alert_type=alert_type)
+        return condition
+    
+    def _cleanup_old_alerts(self, new_alerts, cutoff):
         """
         Auto-acknowledge old alerts when new ones of the same type are generated
         """
-        for new_alert_data in new_alerts:
-            Alert.objects.filter(
-                vehicle=new_alert_data.get('vehicle'),
-                alert_type=new_alert_data['alert_type'],
-                is_active=True,
-                created_at__lt=timezone.now() - timedelta(minutes=30)
-            ).update(
-                is_acknowledged=True,
-                acknowledged_at=timezone.now()
-            )
+        if not new_alerts:
+            return
+        pairs = {(alert.vehicle_id, alert.alert_type) for alert in new_alerts}
+        Alert.objects.filter(
+            self._alert_pairs_filter(pairs),
+            is_active=True,
+            created_at__lt=cutoff
+        ).update(
+            is_acknowledged=True,
+            acknowledged_at=Now()
+        )
 
 class AlertRuleViewSet(viewsets.ModelViewSet):
     """
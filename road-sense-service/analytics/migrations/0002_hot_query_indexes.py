@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('telemetry', '0002_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competitoranalysis',
+            index=models.Index(fields=['-analysis_timestamp'], name='analytics_c_analysi_275ae8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performanceanalysis',
+            index=models.Index(fields=['-analysis_timestamp'], name='analytics_p_analysi_2bf5df_idx'),
+        ),
+    ]
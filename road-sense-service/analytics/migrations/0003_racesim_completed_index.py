@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='racesimulation',
+            index=models.Index(condition=models.Q(('is_completed', True)), fields=['-created_at'], name='racesim_completed_idx'),
+        ),
+    ]
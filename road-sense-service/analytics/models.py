@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from telemetry.models import Vehicle
 
 class PerformanceAnalysis(models.Model):
@@ -11,6 +12,11 @@ class PerformanceAnalysis(models.Model):
     predicted_lap_time = models.FloatField()
     actual_lap_time = models.FloatField(null=True, blank=True)
     analysis_timestamp = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-analysis_timestamp']),
+        ]
 
 class RaceSimulation(models.Model):
     simulation_id = models.CharField(max_length=100, unique=True)
@@ -18,6 +24,11 @@ class RaceSimulation(models.Model):
     results = models.JSONField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_completed = models.BooleanField(default=False)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at'], condition=Q(is_completed=True), name='racesim_completed_idx'),
+        ]
 
 class CompetitorAnalysis(models.Model):
     vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE)
@@ -28,4 +39,9 @@ class CompetitorAnalysis(models.Model):
         ('MEDIUM', 'Medium'),
         ('HIGH', 'High')
     ])
-    analysis_timestamp = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    analysis_timestamp = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['-analysis_timestamp']),
+        ]
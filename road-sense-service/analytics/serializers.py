@@ -6,6 +6,13 @@ class PerformanceAnalysisSerializer(serializers.ModelSerializer):
         model = PerformanceAnalysis
         fields = '__all__'
 
+class PerformanceAnalysisListSerializer(serializers.ModelSerializer):
+    """Lightweight analysis representation for the analytics dashboard"""
+    class Meta:
+        model = PerformanceAnalysis
+        fields = ['id', 'vehicle', 'lap_number', 'tire_degradation_impact', 'fuel_impact',
+                  'weather_impact', 'predicted_lap_time', 'actual_lap_time', 'analysis_timestamp']
+
 class RaceSimulationSerializer(serializers.ModelSerializer):
     class Meta:
         model = RaceSimulation
@@ -17,7 +24,7 @@ class CompetitorAnalysisSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class AnalyticsSummarySerializer(serializers.Serializer):
-    performance_analysis = PerformanceAnalysisSerializer(many=True)
+    performance_analysis = PerformanceAnalysisListSerializer(many=True)
     competitor_analysis = CompetitorAnalysisSerializer(many=True)
     simulation_results = RaceSimulationSerializer(many=True)
     timestamp = serializers.DateTimeField()
\ No newline at end of file
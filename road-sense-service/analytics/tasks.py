@@ -1,135 +1,187 @@
-from celery import shared_task
+from celery import shared_task, chord, group
 from django.utils import timezone
 from datetime import timedelta
+from uuid import uuid4
+from django.db.models import Prefetch
 from .models import PerformanceAnalysis, CompetitorAnalysis, RaceSimulation
 from telemetry.models import TelemetryData, Vehicle
-from strategy.ml_integration import StrategyMLModels
+from strategy.ml_integration import get_ml_models, cached_tire_predictions
+from utils.db_functions import sector_seconds
 
-@shared_task
+# Vehicles fetched and analyses inserted per round in generate_performance_analytics
+ANALYTICS_CHUNK_SIZE = 500
+
+@shared_task(ignore_result=True)
 def generate_performance_analytics():
     """Generate performance analytics for all vehicles"""
     try:
-        ml_models = StrategyMLModels()
-        generated_analytics = []
+        ml_models = get_ml_models()
+        generated_count = 0
+        pending = []
         
-        vehicles = Vehicle.objects.all()
-        for vehicle in vehicles:
-            # Get recent telemetry for this vehicle
-            recent_telemetry = TelemetryData.objects.filter(
-                vehicle=vehicle
-            ).order_by('-timestamp')[:10]
-            
-            if not recent_telemetry:
-                continue
-            
-            latest_telemetry = recent_telemetry[0]
-            
-            # Generate performance analysis
-            analysis_data = _generate_vehicle_analysis(vehicle, recent_telemetry, ml_models)
-            
-            analysis = PerformanceAnalysis.objects.create(
-                vehicle=vehicle,
-                lap_number=latest_telemetry.lap_number,
-                sector_times=analysis_data['sector_times'],
-                tire_degradation_impact=analysis_data['tire_impact'],
-                fuel_impact=analysis_data['fuel_impact'],
-                weather_impact=analysis_data['weather_impact'],
-                predicted_lap_time=analysis_data['predicted_time']
+        # Ten most recent telemetry rows per vehicle, prefetched one chunk of vehicles at a time
+        vehicles = Vehicle.objects.prefetch_related(
+            Prefetch(
+                'telemetrydata_set',
+                queryset=TelemetryData.objects.only(
+                    'id', 'vehicle_id', 'lap_number', 'timestamp'
+                ).annotate(**sector_seconds()).order_by('-timestamp')[:10],
+                to_attr='recent_telemetry'
             )
+        ).iterator(chunk_size=ANALYTICS_CHUNK_SIZE)
+        for vehicle in vehicles:
+            if vehicle.recent_telemetry:
+                pending.append(vehicle)
             
-            generated_analytics.append(f"Analysis for {vehicle}")
+            # Analyse once per chunk so memory stays bounded by the chunk size
+            if len(pending) >= ANALYTICS_CHUNK_SIZE:
+                generated_count += _save_vehicle_analyses(pending, ml_models)
+                pending = []
         
-        return f"Generated analytics for {len(generated_analytics)} vehicles"
+        generated_count += _save_vehicle_analyses(pending, ml_models)
+        
+        return f"Generated analytics for {generated_count} vehicles"
         
     except Exception as e:
         return f"Error generating performance analytics: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def update_competitor_analysis():
     """Update competitor analysis based on current race data"""
     try:
-        # Get all vehicles and their latest telemetry
-        vehicles = Vehicle.objects.all()
+        # Latest telemetry of every vehicle in one query
+        latest_rows = TelemetryData.objects.select_related('vehicle').latest_per_vehicle()
         competitor_data = []
+        analyses = []
         
-        for vehicle in vehicles:
-            latest_telemetry = TelemetryData.objects.filter(
-                vehicle=vehicle
-            ).order_by('-timestamp').first()
+        for latest_telemetry in latest_rows:
+            vehicle = latest_telemetry.vehicle
+            threat_level = _calculate_threat_level(latest_telemetry)
+            
+            analyses.append(CompetitorAnalysis(
+                vehicle=vehicle,
+                lap_number=latest_telemetry.lap_number,
+                competitor_data={
+                    'position': latest_telemetry.position,
+                    'gap_to_leader': latest_telemetry.gap_to_leader,
+                    'recent_lap_trend': 'improving',  # Would calculate from history
+                    'tire_age': latest_telemetry.lap_number % 30,  # Simulated
+                    'last_pit_lap': max(0, latest_telemetry.lap_number - 15)
+                },
+                threat_level=threat_level
+            ))
             
-            if latest_telemetry:
-                threat_level = _calculate_threat_level(latest_telemetry)
-                
-                analysis = CompetitorAnalysis.objects.create(
-                    vehicle=vehicle,
-                    lap_number=latest_telemetry.lap_number,
-                    competitor_data={
-                        'position': latest_telemetry.position,
-                        'gap_to_leader': latest_telemetry.gap_to_leader,
-                        'recent_lap_trend': 'improving',  # Would calculate from history
-                        'tire_age': latest_telemetry.lap_number % 30,  # Simulated
-                        'last_pit_lap': max(0, latest_telemetry.lap_number - 15)
-                    },
-                    threat_level=threat_level
-                )
-                
-                competitor_data.append(f"Competitor analysis for {vehicle}")
+            competitor_data.append(f"Competitor analysis for {vehicle}")
+        
+        CompetitorAnalysis.objects.bulk_create(analyses, batch_size=1000)
         
         return f"Updated {len(competitor_data)} competitor analyses"
         
     except Exception as e:
         return f"Error updating competitor analysis: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def run_batch_simulations(simulation_count=5):
     """Run multiple race simulations for strategy optimization"""
     try:
-        simulations_ran = []
+        simulations = []
+        
+        # Shared by every simulation in the batch
+        prefix = f'batch_{timezone.now().strftime("%Y%m%d_%H%M%S")}'
+        strategy_variants = ['EARLY', 'MIDDLE', 'LATE', 'UNDERCUT']
+        weather_conditions = ['dry', 'mixed', 'wet']
         
         for i in range(simulation_count):
             parameters = {
-                'simulation_id': f'batch_{timezone.now().strftime("%Y%m%d_%H%M%S")}_{i}',
-                'strategy_variants': ['EARLY', 'MIDDLE', 'LATE', 'UNDERCUT'],
-                'weather_conditions': ['dry', 'mixed', 'wet'],
+                # Random suffix keeps ids unique when batches start within the same second
+                'simulation_id': f'{prefix}_{i}_{uuid4().hex[:6]}',
+                'strategy_variants': strategy_variants,
+                'weather_conditions': weather_conditions,
                 'duration_laps': 40
             }
-            
-            # Run simulation (would use your ML models)
-            results = _run_single_simulation(parameters)
-            
-            simulation = RaceSimulation.objects.create(
-                simulation_id=parameters['simulation_id'],
-                parameters=parameters,
-                results=results,
+            simulations.append(run_race_simulation.s(parameters))
+        
+        # Simulations are independent: run them across workers, then save them together
+        chord(group(simulations))(save_batch_simulations.s())
+        
+        return f"Dispatched {len(simulations)} batch simulations"
+        
+    except Exception as e:
+        return f"Error running batch simulations: {str(e)}"
+
+@shared_task
+def run_race_simulation(parameters):
+    """Run a single race simulation as part of a batch"""
+    # Run simulation (would use your ML models)
+    return {
+        'parameters': parameters,
+        'results': _run_single_simulation(parameters)
+    }
+
+@shared_task(ignore_result=True)
+def save_batch_simulations(simulation_outputs):
+    """Store the results of a simulation batch in one insert"""
+    try:
+        simulations = RaceSimulation.objects.bulk_create([
+            RaceSimulation(
+                simulation_id=output['parameters']['simulation_id'],
+                parameters=output['parameters'],
+                results=output['results'],
                 is_completed=True
             )
-            
-            simulations_ran.append(simulation.simulation_id)
+            for output in simulation_outputs
+        ], batch_size=500)
         
-        return f"Ran {len(simulations_ran)} batch simulations"
+        return f"Ran {len(simulations)} batch simulations"
         
     except Exception as e:
-        return f"Error running batch simulations: {str(e)}"
+        return f"Error saving batch simulations: {str(e)}"
+
+def _save_vehicle_analyses(vehicles, ml_models):
+    """Analyse a chunk of vehicles with one batched tire prediction and one insert"""
+    if not vehicles:
+        return 0
+    
+    tire_predictions = cached_tire_predictions(
+        ml_models, [vehicle.recent_telemetry[0] for vehicle in vehicles]
+    )
+    
+    analyses = []
+    for vehicle, tire_prediction in zip(vehicles, tire_predictions):
+        latest_telemetry = vehicle.recent_telemetry[0]
+        
+        # Generate performance analysis
+        analysis_data = _generate_vehicle_analysis(vehicle, vehicle.recent_telemetry, tire_prediction)
+        
+        analyses.append(PerformanceAnalysis(
+            vehicle=vehicle,
+            lap_number=latest_telemetry.lap_number,
+            sector_times=analysis_data['sector_times'],
+            tire_degradation_impact=analysis_data['tire_impact'],
+            fuel_impact=analysis_data['fuel_impact'],
+            weather_impact=analysis_data['weather_impact'],
+            predicted_lap_time=analysis_data['predicted_time']
+        ))
+    
+    PerformanceAnalysis.objects.bulk_create(analyses, batch_size=1000)
+    return len(analyses)
 
-def _generate_vehicle_analysis(vehicle, telemetry_data, ml_models):
+def _generate_vehicle_analysis(vehicle, telemetry_data, tire_prediction):
     """Generate performance analysis for a single vehicle"""
     latest_telemetry = telemetry_data[0]
     
     # Calculate average sector times
-    sector_times = []
     if len(telemetry_data) >= 3:
-        for i in range(3):
-            sector_time = sum(
-                getattr(tel, f'sector{i+1}_time').total_seconds() 
-                for tel in telemetry_data[:3] 
-                if getattr(tel, f'sector{i+1}_time')
-            ) / 3
-            sector_times.append(sector_time)
+        rows = [
+            (tel.sector1_seconds, tel.sector2_seconds, tel.sector3_seconds)
+            for tel in telemetry_data[:3]
+        ]
+        sector_times = [sum(time for time in sector if time) / 3 for sector in zip(*rows)]
     else:
         sector_times = [28.5, 29.0, 27.5]  # Default values
     
     # Use ML models for predictions
-    tire_impact = 0.1  # Would come from tire model
+    tire_impact = tire_prediction.get('grip_loss_rate', 0.1)
     fuel_impact = 0.05  # Would come from fuel model
     weather_impact = 0.08  # Would come from weather model
     
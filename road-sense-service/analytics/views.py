@@ -1,27 +1,58 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
 from django.utils import timezone
+from django.core.cache import cache
 from datetime import timedelta
 from .models import PerformanceAnalysis, RaceSimulation, CompetitorAnalysis
 from .serializers import (
     PerformanceAnalysisSerializer, RaceSimulationSerializer,
-    CompetitorAnalysisSerializer, AnalyticsSummarySerializer
+    PerformanceAnalysisListSerializer, CompetitorAnalysisSerializer,
+    AnalyticsSummarySerializer
 )
 from telemetry.models import TelemetryData, Vehicle  # ← FIXED IMPORT
-from strategy.ml_integration import StrategyMLModels  # ← FIXED IMPORT
+from strategy.ml_integration import get_ml_models  # ← FIXED IMPORT
+from utils.db_functions import DurationSeconds, sector_seconds
+
+# Dashboard summary shared across pollers for a few seconds
+DASHBOARD_CACHE_KEY = 'analytics_dashboard_v1'
+DASHBOARD_CACHE_TTL = 5
+
+# Keyset pagination over the analysis_timestamp index (no COUNT or OFFSET per page)
+class PerformanceAnalysisCursorPagination(CursorPagination):
+    ordering = '-analysis_timestamp'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
 class PerformanceAnalysisViewSet(viewsets.ModelViewSet):
     queryset = PerformanceAnalysis.objects.all().order_by('-analysis_timestamp')
     serializer_class = PerformanceAnalysisSerializer
+    pagination_class = PerformanceAnalysisCursorPagination
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.only(*PerformanceAnalysisListSerializer.Meta.fields)
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return PerformanceAnalysisListSerializer
+        return super().get_serializer_class()
     
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current performance analysis"""
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         
-        # Get latest telemetry data
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
+        # Get latest telemetry data with its times already in seconds
+        latest_telemetry = TelemetryData.objects.only(
+            'id', 'vehicle_id', 'lap_number'
+        ).annotate(
+            lap_seconds=DurationSeconds('lap_time'), **sector_seconds()
+        ).order_by('-timestamp').first()
         
         if not latest_telemetry:
             return Response({'error': 'No telemetry data available'})
@@ -31,7 +62,7 @@ class PerformanceAnalysisViewSet(viewsets.ModelViewSet):
         
         # Save analysis
         analysis = PerformanceAnalysis.objects.create(
-            vehicle=latest_telemetry.vehicle,
+            vehicle_id=latest_telemetry.vehicle_id,
             lap_number=latest_telemetry.lap_number,
             sector_times=analysis_data['sector_times'],
             tire_degradation_impact=analysis_data['tire_impact'],
@@ -45,11 +76,11 @@ class PerformanceAnalysisViewSet(viewsets.ModelViewSet):
     
     def _generate_performance_analysis(self, telemetry, ml_models):
         """Generate performance analysis using ML models"""
-        # Convert sector times to seconds if they're timedelta objects
+        # Sector times arrive in seconds from the database annotations
         sector_times = []
-        for sector in [telemetry.sector1_time, telemetry.sector2_time, telemetry.sector3_time]:
+        for sector in [telemetry.sector1_seconds, telemetry.sector2_seconds, telemetry.sector3_seconds]:
             if sector:
-                sector_times.append(sector.total_seconds())
+                sector_times.append(sector)
             else:
                 sector_times.append(30.0)  # Default if no sector time
         
@@ -58,7 +89,7 @@ class PerformanceAnalysisViewSet(viewsets.ModelViewSet):
             'tire_impact': 0.15,  # From tire model
             'fuel_impact': 0.05,  # From fuel model
             'weather_impact': 0.08,  # From weather model
-            'predicted_time': telemetry.lap_time.total_seconds() + 0.28
+            'predicted_time': telemetry.lap_seconds + 0.28
         }
 
 class RaceSimulationViewSet(viewsets.ModelViewSet):
@@ -104,19 +135,28 @@ class AnalyticsSummaryViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def dashboard(self, request):
         """Get comprehensive analytics summary for dashboard"""
-        # Get recent performance analyses
-        recent_analyses = PerformanceAnalysis.objects.all().order_by('-analysis_timestamp')[:10]
+        dashboard_data = cache.get_or_set(
+            DASHBOARD_CACHE_KEY, self._build_dashboard, DASHBOARD_CACHE_TTL
+        )
+        return Response(dashboard_data)
+    
+    def _build_dashboard(self):
+        """Serialized analytics summary for the dashboard"""
+        # Get recent performance analyses, without the sector_times JSON the dashboard never shows
+        recent_analyses = list(PerformanceAnalysis.objects.only(
+            *PerformanceAnalysisListSerializer.Meta.fields
+        ).order_by('-analysis_timestamp')[:10])
         
         # Get competitor analyses (handle if model doesn't exist)
         competitor_analyses = []
         try:
-            competitor_analyses = CompetitorAnalysis.objects.all().order_by('-analysis_timestamp')[:5]
+            competitor_analyses = list(CompetitorAnalysis.objects.all().order_by('-analysis_timestamp')[:5])
         except:
             # CompetitorAnalysis model might not be implemented yet
             pass
         
         # Get recent simulations
-        recent_simulations = RaceSimulation.objects.filter(is_completed=True).order_by('-created_at')[:3]
+        recent_simulations = list(RaceSimulation.objects.filter(is_completed=True).order_by('-created_at')[:3])
         
         summary_data = {
             'performance_analysis': recent_analyses,
@@ -125,5 +165,4 @@ class AnalyticsSummaryViewSet(viewsets.ViewSet):
             'timestamp': timezone.now()
         }
         
-        serializer = AnalyticsSummarySerializer(summary_data)
-        return Response(serializer.data)
\ No newline at end of file
+        return AnalyticsSummarySerializer(summary_data).data
\ No newline at end of file
@@ -1,6 +1,11 @@
 from django.core.management.base import BaseCommand
+from django.core.cache import cache
+from django.db import transaction
 from utils.data_processors import TelemetryProcessor, WeatherProcessor
-from telemetry.models import WeatherData
+from telemetry.models import TelemetryData, TireTelemetry, WeatherData
+from telemetry.signals import (
+    broadcast_new_telemetry, broadcast_weather_updates, process_new_tire_telemetry
+)
 
 class Command(BaseCommand):
     help = 'Ingest telemetry data from external sources or generate simulated data'
@@ -30,21 +35,35 @@ class Command(BaseCommand):
         if source == 'simulate':
             self.stdout.write(f'Generating {count} simulated telemetry records...')
             
+            telemetry_rows = []
+            tire_rows = []
+            weather_rows = []
+            
             for i in range(count):
                 # Generate telemetry
-                telemetry_data = processor.generate_simulated_telemetry()
-                
-                # Save telemetry
-                for data in telemetry_data:
-                    data.save()
+                for data in processor.generate_simulated_telemetry():
+                    if isinstance(data, TelemetryData):
+                        telemetry_rows.append(data)
+                    else:
+                        tire_rows.append(data)
                 
                 # Generate weather data occasionally
                 if i % 5 == 0:
-                    weather_data = weather_processor.generate_simulated_weather()
-                    weather_data.save()
+                    weather_rows.append(weather_processor.generate_simulated_weather())
                 
                 self.stdout.write(f'Generated batch {i + 1}/{count}')
             
+            # Save everything in one transaction with multi-row INSERTs;
+            # telemetry goes first so the tire rows pick up its primary keys
+            with transaction.atomic():
+                TelemetryData.objects.bulk_create(telemetry_rows, batch_size=2000)
+                TireTelemetry.objects.bulk_create(tire_rows, batch_size=2000)
+                WeatherData.objects.bulk_create(weather_rows, batch_size=2000)
+                
+                # bulk_create skips post_save, so once committed record the newest
+                # row and run the signal side effects ourselves, once per batch
+                transaction.on_commit(lambda: self._after_commit(telemetry_rows, tire_rows, weather_rows))
+            
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully generated {count} telemetry batches')
             )
@@ -77,4 +96,12 @@ class Command(BaseCommand):
             else:
                 self.stdout.write(
                     self.style.ERROR('Failed to process external telemetry')
-                )
\ No newline at end of file
+                )
+    
+    def _after_commit(self, telemetry_rows, tire_rows, weather_rows):
+        """Record the newest telemetry id, broadcast the batch and check tire alerts"""
+        if telemetry_rows:
+            cache.set(TelemetryData.LATEST_ID_CACHE_KEY, telemetry_rows[-1].id, timeout=None)
+        broadcast_new_telemetry(telemetry_rows)
+        process_new_tire_telemetry(tire_rows)
+        broadcast_weather_updates(weather_rows)
\ No newline at end of file
@@ -1,12 +1,34 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from datetime import timedelta
+from django.db import transaction
+from django.core.cache import cache
 import asyncio
+import time
+from asgiref.sync import sync_to_async
 from utils.data_processors import TelemetryProcessor, WeatherProcessor
 from telemetry.models import TelemetryData, WeatherData
-from strategy.ml_integration import StrategyMLModels
+from telemetry.signals import broadcast_new_telemetry
+from strategy.ml_integration import get_ml_models
 from alerts.models import Alert
 
+# Scripted alerts raised at fixed simulation laps
+SIMULATION_ALERTS = {
+    10: {
+        'alert_type': 'TIRE_WEAR',
+        'severity': 'MEDIUM',
+        'title': 'Tire Wear Approaching Threshold',
+        'message': 'Front tires showing increased degradation',
+        'recommended_action': 'Monitor tire performance for next 5 laps',
+    },
+    20: {
+        'alert_type': 'STRATEGY_OPPORTUNITY',
+        'severity': 'HIGH',
+        'title': 'Optimal Pit Window Open',
+        'message': 'Current conditions favor pit stop strategy',
+        'recommended_action': 'Consider pit stop between laps 22-25',
+    },
+}
+
 class Command(BaseCommand):
     help = 'Simulate a complete race with real-time data generation'
     
@@ -29,74 +51,73 @@ class Command(BaseCommand):
         
         duration = options['duration']
         interval = options['interval']
+        self.lap_counter = 1
+        
+        try:
+            asyncio.run(self._run(duration, interval))
+        except KeyboardInterrupt:
+            self.stdout.write('Simulation interrupted by user')
         
+        self.stdout.write(
+            self.style.SUCCESS(f'Simulation completed after {self.lap_counter} laps')
+        )
+    
+    async def _run(self, duration, interval):
+        """Tick laps on a fixed schedule so database time does not accumulate as drift"""
         # Initialize processors
         telemetry_processor = TelemetryProcessor()
         weather_processor = WeatherProcessor()
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
+        simulate_lap = sync_to_async(self._simulate_lap)
+        
+        loop_start = time.monotonic()
+        loop_end = loop_start + duration
         
-        start_time = timezone.now()
-        end_time = start_time + timedelta(seconds=duration)
+        while time.monotonic() < loop_end:
+            current_time = timezone.now()
+            await simulate_lap(
+                self.lap_counter, current_time,
+                telemetry_processor, weather_processor, ml_models
+            )
+            self.stdout.write(f'Simulated lap {self.lap_counter} at {current_time}')
+            
+            # Wait for the next tick, measured from the start rather than from now
+            next_tick = loop_start + self.lap_counter * interval
+            await asyncio.sleep(max(0, next_tick - time.monotonic()))
+            
+            self.lap_counter += 1
+    
+    def _simulate_lap(self, lap_counter, current_time, telemetry_processor, weather_processor, ml_models):
+        """Generate and store one lap of telemetry, weather and alerts"""
+        # Generate telemetry data for current "lap"
+        telemetry_data = telemetry_processor.generate_simulated_telemetry()
         
-        current_time = start_time
-        lap_counter = 1
+        # Update lap numbers to simulate progress
+        lap_telemetry = [data for data in telemetry_data if isinstance(data, TelemetryData)]
+        for data in lap_telemetry:
+            data.lap_number = lap_counter
+            data.timestamp = current_time
         
-        try:
-            while current_time < end_time:
-                # Generate telemetry data for current "lap"
-                telemetry_data = telemetry_processor.generate_simulated_telemetry()
-                
-                # Update lap numbers to simulate progress
-                for data in telemetry_data:
-                    if isinstance(data, TelemetryData):
-                        data.lap_number = lap_counter
-                        data.timestamp = current_time
-                        data.save()
-                
-                # Generate weather data every 5 "laps"
-                if lap_counter % 5 == 0:
-                    weather_data = weather_processor.generate_simulated_weather()
-                    weather_data.timestamp = current_time
-                    weather_data.save()
-                
-                # Generate alerts based on conditions
-                if lap_counter % 10 == 0:
-                    self._generate_simulation_alerts(lap_counter, ml_models)
-                
-                self.stdout.write(f'Simulated lap {lap_counter} at {current_time}')
-                
-                # Wait for next interval
-                import time
-                time.sleep(interval)
-                
-                current_time = timezone.now()
-                lap_counter += 1
+        # One multi-row INSERT per lap; bulk_create skips post_save, so record
+        # the newest row and broadcast the lap ourselves, once per batch
+        with transaction.atomic():
+            TelemetryData.objects.bulk_create(lap_telemetry, batch_size=500)
+        if lap_telemetry:
+            cache.set(TelemetryData.LATEST_ID_CACHE_KEY, lap_telemetry[-1].id, timeout=None)
+        broadcast_new_telemetry(lap_telemetry)
         
-        except KeyboardInterrupt:
-            self.stdout.write('Simulation interrupted by user')
+        # Generate weather data every 5 "laps"
+        if lap_counter % 5 == 0:
+            weather_data = weather_processor.generate_simulated_weather()
+            weather_data.timestamp = current_time
+            weather_data.save()
         
-        self.stdout.write(
-            self.style.SUCCESS(f'Simulation completed after {lap_counter} laps')
-        )
+        # Generate alerts based on conditions
+        if lap_counter % 10 == 0:
+            self._generate_simulation_alerts(lap_counter, ml_models)
     
     def _generate_simulation_alerts(self, lap_number, ml_models):
         """Generate simulation alerts based on lap conditions"""
-        if lap_number == 10:
-            Alert.objects.create(
-                alert_type='TIRE_WEAR',
-                severity='MEDIUM',
-                title='Tire Wear Approaching Threshold',
-                message='Front tires showing increased degradation',
-                recommended_action='Monitor tire performance for next 5 laps',
-                triggered_by={'simulation_lap': lap_number}
-            )
-        
-        elif lap_number == 20:
-            Alert.objects.create(
-                alert_type='STRATEGY_OPPORTUNITY',
-                severity='HIGH',
-                title='Optimal Pit Window Open',
-                message='Current conditions favor pit stop strategy',
-                recommended_action='Consider pit stop between laps 22-25',
-                triggered_by={'simulation_lap': lap_number}
-            )
\ No newline at end of file
+        alert = SIMULATION_ALERTS.get(lap_number)
+        if alert:
+            Alert.objects.create(triggered_by={'simulation_lap': lap_number}, **alert)
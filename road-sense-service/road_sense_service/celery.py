@@ -1,6 +1,7 @@
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 from django.conf import settings
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'road_sense_service.settings')
@@ -94,6 +95,12 @@ app.conf.beat_schedule = {
     },
 }
 
+@worker_process_init.connect
+def warm_ml_models(**kwargs):
+    """Load the shared ML models once per worker process, before the first task"""
+    from strategy.ml_integration import get_ml_models
+    get_ml_models().load_models()
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
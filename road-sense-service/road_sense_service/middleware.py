@@ -1,9 +1,18 @@
-# class HealthCheckMiddleware:
-#     def __init__(self, get_response):
-#         self.get_response = get_response
-
-#     def __call__(self, request):
-#         if request.path == '/health/':
-#             from django.http import JsonResponse
-#             return JsonResponse({'status': 'healthy'})
-#         return self.get_response(request)
\ No newline at end of file
+from django.http import HttpResponse
+
+HEALTH_CHECK_PATH = '/health/'
+HEALTH_CHECK_BODY = b'{"status": "healthy"}'
+
+
+class HealthCheckMiddleware:
+    """
+    Answer load balancer health probes before the rest of the middleware
+    stack runs. Keep this first in MIDDLEWARE.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == HEALTH_CHECK_PATH:
+            return HttpResponse(HEALTH_CHECK_BODY, content_type='application/json')
+        return self.get_response(request)
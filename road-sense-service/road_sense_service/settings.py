@@ -163,7 +163,10 @@ CORS_ALLOW_HEADERS = [
 
 # PRODUCTION SETTINGS
 # settings.py - PRODUCTION VERSION
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Sessions are read from Redis and written through to the django_session table,
+# so a cache eviction or Redis restart does not log users out
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_SAMESITE = 'None'  # 'None' for cross-domain in production
 SESSION_COOKIE_SECURE = True  # True in production with HTTPS
 SESSION_COOKIE_HTTPONLY = True
@@ -211,6 +214,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'road_sense_service.middleware.HealthCheckMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -250,6 +254,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
         'rest_framework.renderers.JSONRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -342,6 +347,14 @@ DATABASE_SCHEMAS = {
 }
 
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+}
+
+
 CHANNEL_LAYERS = {
     'default': {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
@@ -389,6 +402,14 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Existing PBKDF2 hashes keep verifying and are upgraded to Argon2 on next login
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+
 AUTH_USER_MODEL = 'accounts.User'
 
 LOGIN_URL = '/api/accounts/auth/login/'
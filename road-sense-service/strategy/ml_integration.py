@@ -1,43 +1,64 @@
 import joblib
 import numpy as np
 from django.conf import settings
+from django.core.cache import cache
+from functools import lru_cache
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 class StrategyMLModels:
+    # Output columns of the tire model, in order (see tire_trainer.py)
+    TIRE_TARGETS = ('degradation_s1', 'degradation_s2', 'degradation_s3', 'grip_loss_rate')
+    
+    # attribute name -> pickle file in settings.ML_MODELS_DIR
+    MODEL_FILES = {
+        'tire_model': 'tire_degradation_model.pkl',
+        'pit_strategy_model': 'pit_strategy_model.pkl',
+        'fuel_model': 'fuel_model.pkl',
+        'weather_model': 'weather_model.pkl',
+    }
+    
     def __init__(self):
-        self.tire_model = None
-        self.pit_strategy_model = None
-        self.fuel_model = None
-        self.weather_model = None
-        self.load_models()
+        self._models = {}
+    
+    def _get_model(self, name):
+        """
+        Load a model on first use. mmap_mode='r' keeps large arrays file-backed,
+        so worker processes share the same pages instead of each holding a copy.
+        """
+        if name not in self._models:
+            model = None
+            try:
+                model_path = os.path.join(settings.ML_MODELS_DIR, self.MODEL_FILES[name])
+                if os.path.exists(model_path):
+                    model = joblib.load(model_path, mmap_mode='r')
+            except Exception:
+                logger.exception("Error loading ML model %s", name)
+            self._models[name] = model
+        return self._models[name]
+    
+    @property
+    def tire_model(self):
+        return self._get_model('tire_model')
+    
+    @property
+    def pit_strategy_model(self):
+        return self._get_model('pit_strategy_model')
+    
+    @property
+    def fuel_model(self):
+        return self._get_model('fuel_model')
+    
+    @property
+    def weather_model(self):
+        return self._get_model('weather_model')
     
     def load_models(self):
-        """Load all trained ML models"""
-        try:
-            models_dir = settings.ML_MODELS_DIR
-            
-            # Load tire degradation model
-            tire_model_path = os.path.join(models_dir, 'tire_degradation_model.pkl')
-            if os.path.exists(tire_model_path):
-                self.tire_model = joblib.load(tire_model_path)
-            
-            # Load pit strategy model
-            pit_model_path = os.path.join(models_dir, 'pit_strategy_model.pkl')
-            if os.path.exists(pit_model_path):
-                self.pit_strategy_model = joblib.load(pit_model_path)
-            
-            # Load fuel model
-            fuel_model_path = os.path.join(models_dir, 'fuel_model.pkl')
-            if os.path.exists(fuel_model_path):
-                self.fuel_model = joblib.load(fuel_model_path)
-            
-            # Load weather model
-            weather_model_path = os.path.join(models_dir, 'weather_model.pkl')
-            if os.path.exists(weather_model_path):
-                self.weather_model = joblib.load(weather_model_path)
-                
-        except Exception as e:
-            print(f"Error loading ML models: {e}")
+        """Load all trained ML models now instead of on first prediction"""
+        for name in self.MODEL_FILES:
+            self._get_model(name)
     
     def predict_tire_degradation(self, telemetry_data):
         """Predict tire degradation using your trained model"""
@@ -53,6 +74,23 @@ class StrategyMLModels:
             print(f"Tire prediction error: {e}")
             return self._fallback_tire_prediction(telemetry_data)
     
+    def predict_tire_degradation_batch(self, telemetry_rows):
+        """Predict tire degradation for many telemetry rows in one model call"""
+        if not self.tire_model:
+            return [self._fallback_tire_prediction(row) for row in telemetry_rows]
+        
+        try:
+            features = np.vstack([self._prepare_tire_features(row) for row in telemetry_rows])
+            predictions = np.asarray(self.tire_model.predict(features)).reshape(len(telemetry_rows), -1)
+            # Same dict shape as the fallback, with the model's columns filled in
+            return [
+                {**self._fallback_tire_prediction(row), **dict(zip(self.TIRE_TARGETS, map(float, values)))}
+                for row, values in zip(telemetry_rows, predictions)
+            ]
+        except Exception:
+            logger.exception("Tire batch prediction error")
+            return [self._fallback_tire_prediction(row) for row in telemetry_rows]
+    
     def predict_pit_strategy(self, race_data):
         """Predict optimal pit strategy using your trained model"""
         if not self.pit_strategy_model:
@@ -68,6 +106,20 @@ class StrategyMLModels:
             print(f"Pit strategy prediction error: {e}")
             return self._fallback_pit_prediction(race_data)
     
+    def predict_pit_strategy_batch(self, race_data_rows):
+        """Predict pit strategy for many race data rows in one model call"""
+        if not self.pit_strategy_model:
+            return [self._fallback_pit_strategy_prediction(row) for row in race_data_rows]
+        
+        try:
+            features = np.vstack([self._prepare_pit_features(row) for row in race_data_rows])
+            predictions = self.pit_strategy_model.predict(features)
+            confidences = self.pit_strategy_model.predict_proba(features).max(axis=1)
+            return list(zip(predictions, confidences))
+        except Exception:
+            logger.exception("Pit strategy batch prediction error")
+            return [self._fallback_pit_strategy_prediction(row) for row in race_data_rows]
+    
     def _prepare_tire_features(self, telemetry_data):
         """Prepare features for tire degradation model"""
         # Implement feature preparation based on your tire_trainer.py
@@ -92,4 +144,40 @@ class StrategyMLModels:
     
     def _fallback_pit_strategy_prediction(self, race_data):
         """Fallback pit strategy prediction"""
-        return 'MIDDLE', 0.7
\ No newline at end of file
+        return 'MIDDLE', 0.7
+
+@lru_cache(maxsize=1)
+def get_ml_models():
+    """
+    Process-wide StrategyMLModels instance so weights are loaded once.
+    Call get_ml_models.cache_clear() to pick up retrained models.
+    """
+    return StrategyMLModels()
+
+def _tire_prediction_key(telemetry):
+    return f'tire_prediction:{telemetry.pk}:{telemetry.timestamp.timestamp()}'
+
+def cached_tire_prediction(ml_models, telemetry, timeout=30):
+    """Tire degradation prediction memoized per telemetry row"""
+    return cache.get_or_set(
+        _tire_prediction_key(telemetry),
+        lambda: ml_models.predict_tire_degradation(telemetry),
+        timeout
+    )
+
+def cached_tire_predictions(ml_models, telemetry_rows, timeout=30):
+    """Batch form of cached_tire_prediction; misses are predicted in one call"""
+    keys = [_tire_prediction_key(telemetry) for telemetry in telemetry_rows]
+    predictions = cache.get_many(keys)
+    missing = [
+        (key, telemetry) for key, telemetry in zip(keys, telemetry_rows)
+        if key not in predictions
+    ]
+    if missing:
+        fresh = dict(zip(
+            (key for key, _ in missing),
+            ml_models.predict_tire_degradation_batch([telemetry for _, telemetry in missing])
+        ))
+        cache.set_many(fresh, timeout)
+        predictions.update(fresh)
+    return [predictions[key] for key in keys]
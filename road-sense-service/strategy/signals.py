@@ -1,3 +1,4 @@
+import asyncio
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.db import transaction
@@ -29,14 +30,11 @@ def handle_new_fuel_strategy(sender, instance, created, **kwargs):
     if created:
         transaction.on_commit(lambda: _broadcast_fuel_strategy(instance))
 
-def _broadcast_strategy_update(strategy):
-    """
-    Broadcast strategy update via WebSocket
-    """
-    try:
-        channel_layer = get_channel_layer()
-        
-        strategy_data = {
+def _strategy_message(strategy):
+    """Build the WebSocket payload for a pit strategy"""
+    return {
+        'type': 'strategy.update',
+        'data': {
             'vehicle_id': strategy.vehicle.vehicle_id,
             'recommended_lap': strategy.recommended_lap,
             'strategy_type': strategy.strategy_type,
@@ -44,14 +42,50 @@ def _broadcast_strategy_update(strategy):
             'reasoning': strategy.reasoning,
             'timestamp': strategy.created_at.isoformat()
         }
-        
-        async_to_sync(channel_layer.group_send)(
-            'strategy_updates',
-            {
-                'type': 'strategy.update',
-                'data': strategy_data
-            }
-        )
+    }
+
+def _tire_strategy_message(strategy):
+    """Build the WebSocket payload for a tire strategy"""
+    return {
+        'type': 'tire_strategy.update',
+        'data': {
+            'vehicle_id': strategy.vehicle.vehicle_id,
+            'predicted_laps_remaining': strategy.predicted_laps_remaining,
+            'degradation_rate': strategy.degradation_rate,
+            'optimal_change_lap': strategy.optimal_change_lap,
+            'confidence': strategy.confidence,
+            'timestamp': strategy.created_at.isoformat()
+        }
+    }
+
+def _fuel_strategy_message(strategy):
+    """Build the WebSocket payload for a fuel strategy"""
+    return {
+        'type': 'fuel_strategy.update',
+        'data': {
+            'vehicle_id': strategy.vehicle.vehicle_id,
+            'current_fuel': strategy.current_fuel,
+            'predicted_laps_remaining': strategy.predicted_laps_remaining,
+            'consumption_rate': strategy.consumption_rate,
+            'need_to_conserve': strategy.need_to_conserve,
+            'timestamp': strategy.created_at.isoformat()
+        }
+    }
+
+async def _send_many(messages):
+    """Send all strategy messages concurrently on one event loop"""
+    channel_layer = get_channel_layer()
+    await asyncio.gather(*[
+        channel_layer.group_send('strategy_updates', message)
+        for message in messages
+    ])
+
+def _broadcast_strategy_update(strategy):
+    """
+    Broadcast strategy update via WebSocket
+    """
+    try:
+        async_to_sync(_send_many)([_strategy_message(strategy)])
         
         print(f"Broadcast strategy update for vehicle {strategy.vehicle.vehicle_id}")
         
@@ -62,25 +96,17 @@ def _broadcast_tire_strategy(strategy):
     """
     Broadcast tire strategy update
     """
+    broadcast_tire_strategies([strategy])
+
+def broadcast_tire_strategies(strategies):
+    """
+    Broadcast many tire strategies with a single async_to_sync round trip,
+    for callers that bulk_create and so bypass post_save
+    """
+    if not strategies:
+        return
     try:
-        channel_layer = get_channel_layer()
-        
-        tire_data = {
-            'vehicle_id': strategy.vehicle.vehicle_id,
-            'predicted_laps_remaining': strategy.predicted_laps_remaining,
-            'degradation_rate': strategy.degradation_rate,
-            'optimal_change_lap': strategy.optimal_change_lap,
-            'confidence': strategy.confidence,
-            'timestamp': strategy.created_at.isoformat()
-        }
-        
-        async_to_sync(channel_layer.group_send)(
-            'strategy_updates',
-            {
-                'type': 'tire_strategy.update',
-                'data': tire_data
-            }
-        )
+        async_to_sync(_send_many)([_tire_strategy_message(strategy) for strategy in strategies])
         
     except Exception as e:
         print(f"Error broadcasting tire strategy: {e}")
@@ -90,24 +116,7 @@ def _broadcast_fuel_strategy(strategy):
     Broadcast fuel strategy update
     """
     try:
-        channel_layer = get_channel_layer()
-        
-        fuel_data = {
-            'vehicle_id': strategy.vehicle.vehicle_id,
-            'current_fuel': strategy.current_fuel,
-            'predicted_laps_remaining': strategy.predicted_laps_remaining,
-            'consumption_rate': strategy.consumption_rate,
-            'need_to_conserve': strategy.need_to_conserve,
-            'timestamp': strategy.created_at.isoformat()
-        }
-        
-        async_to_sync(channel_layer.group_send)(
-            'strategy_updates',
-            {
-                'type': 'fuel_strategy.update',
-                'data': fuel_data
-            }
-        )
+        async_to_sync(_send_many)([_fuel_strategy_message(strategy)])
         
     except Exception as e:
-        print(f"Error broadcasting fuel strategy: {e}")
\ No newline at end of file
+        print(f"Error broadcasting fuel strategy: {e}")
@@ -1,30 +1,31 @@
 from celery import shared_task
 from django.utils import timezone
 from .models import PitStrategy, TireStrategy, FuelStrategy
-from .ml_integration import StrategyMLModels
+from .ml_integration import get_ml_models, cached_tire_predictions
+from .signals import broadcast_tire_strategies
 from telemetry.models import TelemetryData, Vehicle
 
-@shared_task
+@shared_task(ignore_result=True)
 def update_strategy_predictions():
     """Update strategy predictions using ML models"""
     try:
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         updated_strategies = []
+        tire_strategies = []
         
-        # Get latest telemetry for all vehicles
-        vehicles = Vehicle.objects.all()
+        # Get latest telemetry for all vehicles in one query (DISTINCT ON);
+        # vehicles without telemetry have no row and are skipped
+        latest_rows = list(TelemetryData.objects.select_related('vehicle').latest_per_vehicle())
         
-        for vehicle in vehicles:
-            latest_telemetry = TelemetryData.objects.filter(
-                vehicle=vehicle
-            ).order_by('-timestamp').first()
-            
-            if not latest_telemetry:
-                continue
-            
-            # Generate pit strategy prediction
-            race_data = _prepare_race_data(latest_telemetry)
-            strategy_type, confidence = ml_models.predict_pit_strategy(race_data)
+        # Predict pit and tire strategy for every vehicle in one model call each
+        race_data_rows = [_prepare_race_data(telemetry) for telemetry in latest_rows]
+        pit_predictions = ml_models.predict_pit_strategy_batch(race_data_rows)
+        tire_predictions = cached_tire_predictions(ml_models, latest_rows)
+        
+        for latest_telemetry, race_data, (strategy_type, confidence), tire_prediction in zip(
+            latest_rows, race_data_rows, pit_predictions, tire_predictions
+        ):
+            vehicle = latest_telemetry.vehicle
             
             # Update or create pit strategy
             pit_strategy, created = PitStrategy.objects.update_or_create(
@@ -32,7 +33,7 @@ def update_strategy_predictions():
                 is_active=True,
                 defaults={
                     'recommended_lap': race_data['current_lap'] + _calculate_pit_offset(strategy_type),
-                    'confidence': confidence[0].max() if hasattr(confidence, '__len__') else confidence,
+                    'confidence': confidence,
                     'strategy_type': strategy_type,
                     'reasoning': f"ML prediction based on lap {race_data['current_lap']} conditions"
                 }
@@ -40,16 +41,19 @@ def update_strategy_predictions():
             updated_strategies.append(f"Pit strategy for {vehicle}")
             
             # Generate tire strategy
-            tire_prediction = ml_models.predict_tire_degradation(latest_telemetry)
-            tire_strategy = TireStrategy.objects.create(
+            tire_strategies.append(TireStrategy(
                 vehicle=vehicle,
                 predicted_laps_remaining=tire_prediction.get('predicted_laps_remaining', 15),
                 degradation_rate=tire_prediction.get('grip_loss_rate', 0.1),
                 optimal_change_lap=latest_telemetry.lap_number + tire_prediction.get('predicted_laps_remaining', 15),
                 confidence=0.8
-            )
+            ))
             updated_strategies.append(f"Tire strategy for {vehicle}")
         
+        # One INSERT for all tire strategies; bulk_create skips post_save,
+        # so broadcast them here the way handle_new_tire_strategy would
+        broadcast_tire_strategies(TireStrategy.objects.bulk_create(tire_strategies, batch_size=500))
+        
         return f"Updated strategies: {', '.join(updated_strategies)}"
         
     except Exception as e:
@@ -59,7 +63,7 @@ def update_strategy_predictions():
 def simulate_race_strategy(parameters):
     """Run comprehensive race strategy simulation"""
     try:
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         
         # This would run your comprehensive race simulation
         simulation_results = {
@@ -98,13 +102,15 @@ def _prepare_race_data(telemetry):
         'lap_time_trend': 'stable'  # Would calculate from recent laps
     }
 
+# Pit lap offset per strategy type, built once at import
+PIT_OFFSETS = {
+    'EARLY': 5,
+    'MIDDLE': 10,
+    'LATE': 15,
+    'UNDERCUT': 3,
+    'OVERCUT': 12
+}
+
 def _calculate_pit_offset(strategy_type):
     """Calculate pit lap offset based on strategy type"""
-    offsets = {
-        'EARLY': 5,
-        'MIDDLE': 10,
-        'LATE': 15,
-        'UNDERCUT': 3,
-        'OVERCUT': 12
-    }
-    return offsets.get(strategy_type, 10)
\ No newline at end of file
+    return PIT_OFFSETS.get(strategy_type, 10)
\ No newline at end of file
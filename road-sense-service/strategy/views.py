@@ -7,7 +7,7 @@ from .serializers import (
     PitStrategySerializer, TireStrategySerializer, 
     FuelStrategySerializer, StrategyPredictionSerializer
 )
-from .ml_integration import StrategyMLModels
+from .ml_integration import get_ml_models, cached_tire_prediction
 from telemetry.models import TelemetryData, Vehicle  # ← FIXED IMPORT
 
 class PitStrategyViewSet(viewsets.ModelViewSet):
@@ -17,10 +17,10 @@ class PitStrategyViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current pit strategy recommendations"""
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         
         # Get latest telemetry data
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
+        latest_telemetry = TelemetryData.objects.select_related('vehicle').order_by('-timestamp').first()
         
         if not latest_telemetry:
             return Response({'error': 'No telemetry data available'})
@@ -61,16 +61,16 @@ class TireStrategyViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current tire strategy"""
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         
         # Get latest telemetry
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
+        latest_telemetry = TelemetryData.objects.select_related('vehicle').order_by('-timestamp').first()
         
         if not latest_telemetry:
             return Response({'error': 'No telemetry data available'})
         
         # Predict tire degradation
-        tire_prediction = ml_models.predict_tire_degradation(latest_telemetry)
+        tire_prediction = cached_tire_prediction(ml_models, latest_telemetry)
         
         # Create tire strategy
         strategy_obj = TireStrategy.objects.create(
@@ -88,10 +88,10 @@ class StrategyPredictionViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def comprehensive(self, request):
         """Get comprehensive strategy prediction - FIXED LOGIC"""
-        ml_models = StrategyMLModels()
+        ml_models = get_ml_models()
         
         # Get latest telemetry to ensure we have data
-        latest_telemetry = TelemetryData.objects.all().order_by('-timestamp').first()
+        latest_telemetry = TelemetryData.objects.select_related('vehicle').order_by('-timestamp').first()
         if not latest_telemetry:
             return Response({'error': 'No telemetry data available'})
         
@@ -116,7 +116,7 @@ class StrategyPredictionViewSet(viewsets.ViewSet):
         # Get or create tire strategy
         tire_strategy = TireStrategy.objects.all().order_by('-created_at').first()
         if not tire_strategy:
-            tire_prediction = ml_models.predict_tire_degradation(latest_telemetry)
+            tire_prediction = cached_tire_prediction(ml_models, latest_telemetry)
             tire_strategy = TireStrategy.objects.create(
                 vehicle=latest_telemetry.vehicle,
                 predicted_laps_remaining=tire_prediction.get('predicted_laps_remaining', 15),
@@ -1,4 +1,4 @@
-from .celery import app
+from road_sense_service.celery import app
 
 
 
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telemetry', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='telemetrydata',
+            index=models.Index(fields=['vehicle', '-timestamp'], name='telemetry_t_vehicle_a8e44c_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.contrib.auth.models import User
 
 class Vehicle(models.Model):
@@ -10,7 +12,28 @@ class Vehicle(models.Model):
     def __str__(self):
         return f"#{self.number} - {self.driver}"
 
+class TelemetryDataQuerySet(models.QuerySet):
+    def latest_per_vehicle(self):
+        """
+        Newest row of each vehicle in one DISTINCT ON query. Keep the ordering:
+        DISTINCT ON requires it to start with vehicle_id.
+        """
+        return self.order_by('vehicle_id', '-timestamp').distinct('vehicle_id')
+    
+    def recent_per_vehicle(self, count):
+        """Newest `count` rows of each vehicle, numbered with a window"""
+        return self.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F('vehicle_id')],
+                order_by=F('timestamp').desc()
+            )
+        ).filter(row_number__lte=count)
+
 class TelemetryData(models.Model):
+    # Cache key holding the id of the newest telemetry row
+    LATEST_ID_CACHE_KEY = 'telemetry:latest_id'
+    
     vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE)
     lap_number = models.IntegerField()
     lap_time = models.DurationField()
@@ -26,10 +49,13 @@ class TelemetryData(models.Model):
     gap_to_leader = models.FloatField(help_text="Gap in seconds")
     timestamp = models.DateTimeField(auto_now_add=True)
     
+    objects = TelemetryDataQuerySet.as_manager()
+    
     class Meta:
         indexes = [
             models.Index(fields=['vehicle', 'lap_number']),
             models.Index(fields=['timestamp']),
+            models.Index(fields=['vehicle', '-timestamp']),
         ]
 
 class TireTelemetry(models.Model):
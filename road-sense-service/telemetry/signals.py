@@ -1,6 +1,8 @@
+import asyncio
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.db import transaction
+from django.core.cache import cache
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 from .models import TelemetryData, WeatherData, TireTelemetry
@@ -17,6 +19,10 @@ def handle_new_telemetry(sender, instance, created, **kwargs):
     - Check alert conditions
     """
     if created:
+        # Newest row by id is also newest by timestamp (auto_now_add)
+        transaction.on_commit(
+            lambda: cache.set(TelemetryData.LATEST_ID_CACHE_KEY, instance.id, timeout=None)
+        )
         # Don't block the main thread - use transaction.on_commit
         transaction.on_commit(lambda: _process_new_telemetry(instance))
 
@@ -49,16 +55,11 @@ def handle_telemetry_deletion(sender, instance, **kwargs):
     """
     transaction.on_commit(lambda: _cleanup_after_telemetry_deletion(instance))
 
-def _process_new_telemetry(telemetry):
-    """
-    Process new telemetry data asynchronously
-    """
-    try:
-        # Broadcast via WebSocket
-        channel_layer = get_channel_layer()
-        
-        # Prepare telemetry data for broadcasting
-        telemetry_data = {
+def _telemetry_message(telemetry):
+    """Build the WebSocket payload for a telemetry row"""
+    return {
+        'type': 'telemetry.update',
+        'data': {
             'vehicle_id': telemetry.vehicle.vehicle_id,
             'lap_number': telemetry.lap_number,
             'lap_time': telemetry.lap_time.total_seconds(),
@@ -71,14 +72,34 @@ def _process_new_telemetry(telemetry):
             'brake': telemetry.brake,
             'timestamp': telemetry.timestamp.isoformat()
         }
-        
+    }
+
+async def _send_many(group, messages):
+    """Send all messages to a group concurrently on one event loop"""
+    channel_layer = get_channel_layer()
+    await asyncio.gather(*[
+        channel_layer.group_send(group, message)
+        for message in messages
+    ])
+
+def _process_new_telemetry(telemetry):
+    """
+    Process new telemetry data asynchronously
+    """
+    broadcast_new_telemetry([telemetry])
+
+def broadcast_new_telemetry(telemetry_rows):
+    """
+    Broadcast a batch of new telemetry rows in one async_to_sync round trip and
+    trigger the follow-up tasks once for the whole batch. For callers that
+    bulk_create telemetry and so bypass post_save.
+    """
+    if not telemetry_rows:
+        return
+    try:
         # Broadcast to telemetry group
-        async_to_sync(channel_layer.group_send)(
-            'telemetry_updates',
-            {
-                'type': 'telemetry.update',
-                'data': telemetry_data
-            }
+        async_to_sync(_send_many)(
+            'telemetry_updates', [_telemetry_message(telemetry) for telemetry in telemetry_rows]
         )
         
         # Trigger strategy updates
@@ -88,23 +109,19 @@ def _process_new_telemetry(telemetry):
         check_alert_conditions.delay()
         
         # Generate analytics for important laps
-        if telemetry.lap_number % 5 == 0:  # Every 5 laps
+        if any(telemetry.lap_number % 5 == 0 for telemetry in telemetry_rows):  # Every 5 laps
             generate_performance_analytics.delay()
             
-        print(f"Processed new telemetry for vehicle {telemetry.vehicle.vehicle_id}, lap {telemetry.lap_number}")
+        print(f"Processed {len(telemetry_rows)} new telemetry rows")
         
     except Exception as e:
         print(f"Error processing new telemetry: {e}")
 
-def _process_weather_update(weather_data):
-    """
-    Process new weather data
-    """
-    try:
-        channel_layer = get_channel_layer()
-        
-        # Prepare weather data for broadcasting
-        weather_update = {
+def _weather_message(weather_data):
+    """Build the WebSocket payload for a weather row"""
+    return {
+        'type': 'weather.update',
+        'data': {
             'track_temperature': weather_data.track_temperature,
             'air_temperature': weather_data.air_temperature,
             'humidity': weather_data.humidity,
@@ -114,31 +131,41 @@ def _process_weather_update(weather_data):
             'rainfall': weather_data.rainfall,
             'timestamp': weather_data.timestamp.isoformat()
         }
-        
+    }
+
+def _process_weather_update(weather_data):
+    """
+    Process new weather data
+    """
+    broadcast_weather_updates([weather_data])
+
+def broadcast_weather_updates(weather_rows):
+    """
+    Broadcast a batch of new weather rows in one async_to_sync round trip and
+    trigger one strategy recalculation. For callers that bulk_create weather.
+    """
+    if not weather_rows:
+        return
+    try:
         # Broadcast to weather group
-        async_to_sync(channel_layer.group_send)(
-            'weather_updates',
-            {
-                'type': 'weather.update',
-                'data': weather_update
-            }
+        async_to_sync(_send_many)(
+            'weather_updates', [_weather_message(weather_data) for weather_data in weather_rows]
         )
         
         # Trigger strategy recalculations due to weather change
         update_strategy_predictions.delay()
         
-        print(f"Processed new weather data: {weather_data.track_temperature}°C track, {weather_data.air_temperature}°C air")
+        latest = weather_rows[-1]
+        print(f"Processed new weather data: {latest.track_temperature}°C track, {latest.air_temperature}°C air")
         
     except Exception as e:
         print(f"Error processing weather update: {e}")
 
-def _process_tire_telemetry(tire_data):
-    """
-    Process new tire telemetry data
-    """
-    try:
-        # Prepare tire data for analysis
-        tire_analysis = {
+def _tire_message(tire_data):
+    """Build the WebSocket payload for a tire telemetry row"""
+    return {
+        'type': 'tire.update',
+        'data': {
             'vehicle_id': tire_data.telemetry.vehicle.vehicle_id,
             'lap_number': tire_data.telemetry.lap_number,
             'front_left_temp': tire_data.front_left_temp,
@@ -151,86 +178,108 @@ def _process_tire_telemetry(tire_data):
             'rear_right_pressure': tire_data.rear_right_pressure,
             'timestamp': tire_data.telemetry.timestamp.isoformat()
         }
-        
+    }
+
+def _process_tire_telemetry(tire_data):
+    """
+    Process new tire telemetry data
+    """
+    process_new_tire_telemetry([tire_data])
+
+def process_new_tire_telemetry(tire_rows):
+    """
+    Broadcast a batch of new tire rows in one async_to_sync round trip and
+    check tire alerts for the whole batch. For callers that bulk_create tires.
+    """
+    if not tire_rows:
+        return
+    try:
         # Broadcast tire data
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            'tire_updates',
-            {
-                'type': 'tire.update',
-                'data': tire_analysis
-            }
-        )
-        
-        # Check for tire-specific alerts
-        _check_tire_alerts(tire_data)
+        async_to_sync(_send_many)('tire_updates', [_tire_message(tire_data) for tire_data in tire_rows])
         
-        print(f"Processed tire telemetry for vehicle {tire_data.telemetry.vehicle.vehicle_id}")
+        print(f"Processed {len(tire_rows)} tire telemetry rows")
         
     except Exception as e:
         print(f"Error processing tire telemetry: {e}")
+    
+    # Check for tire-specific alerts, even if the broadcast failed
+    _check_tire_alerts(tire_rows)
 
-def _check_tire_alerts(tire_data):
+def _tire_alert_data(tire_data):
     """
-    Check for tire-related alert conditions
+    Alert fields for the tire-related conditions one tire row triggers
+    """
+    alerts = []
+    
+    # Check temperature differentials
+    temp_diff_front = abs(tire_data.front_left_temp - tire_data.front_right_temp)
+    if temp_diff_front > 15:  # 15°C difference threshold
+        alerts.append({
+            'vehicle': tire_data.telemetry.vehicle,
+            'alert_type': 'TIRE_WEAR',
+            'severity': 'MEDIUM',
+            'title': 'Uneven Front Tire Temperatures',
+            'message': f'Front tire temperature difference: {temp_diff_front:.1f}°C',
+            'recommended_action': 'Check tire pressures and suspension setup',
+            'triggered_by': {
+                'temperature_difference': temp_diff_front,
+                'front_left_temp': tire_data.front_left_temp,
+                'front_right_temp': tire_data.front_right_temp
+            }
+        })
+    
+    # Check for overheating tires
+    if tire_data.front_left_temp > 110 or tire_data.front_right_temp > 110:
+        alerts.append({
+            'vehicle': tire_data.telemetry.vehicle,
+            'alert_type': 'TIRE_WEAR',
+            'severity': 'HIGH',
+            'title': 'High Tire Temperatures',
+            'message': f'Tire temperatures exceeding optimal range (>{110}°C)',
+            'recommended_action': 'Consider reducing pace or adjusting setup',
+            'triggered_by': {
+                'front_left_temp': tire_data.front_left_temp,
+                'front_right_temp': tire_data.front_right_temp
+            }
+        })
+    
+    # Check pressure anomalies
+    pressure_diff_front = abs(tire_data.front_left_pressure - tire_data.front_right_pressure)
+    if pressure_diff_front > 1.0:  # 1.0 PSI difference threshold
+        alerts.append({
+            'vehicle': tire_data.telemetry.vehicle,
+            'alert_type': 'SYSTEM_WARNING',
+            'severity': 'MEDIUM',
+            'title': 'Uneven Tire Pressures',
+            'message': f'Front tire pressure difference: {pressure_diff_front:.1f} PSI',
+            'recommended_action': 'Check for leaks and adjust pressures',
+            'triggered_by': {
+                'pressure_difference': pressure_diff_front,
+                'front_left_pressure': tire_data.front_left_pressure,
+                'front_right_pressure': tire_data.front_right_pressure
+            }
+        })
+    
+    return alerts
+
+def _check_tire_alerts(tire_rows):
+    """
+    Check for tire-related alert conditions across a batch of tire rows
     """
     try:
         from alerts.models import Alert
         
-        alerts = []
-        
-        # Check temperature differentials
-        temp_diff_front = abs(tire_data.front_left_temp - tire_data.front_right_temp)
-        if temp_diff_front > 15:  # 15°C difference threshold
-            alerts.append({
-                'vehicle': tire_data.telemetry.vehicle,
-                'alert_type': 'TIRE_WEAR',
-                'severity': 'MEDIUM',
-                'title': 'Uneven Front Tire Temperatures',
-                'message': f'Front tire temperature difference: {temp_diff_front:.1f}°C',
-                'recommended_action': 'Check tire pressures and suspension setup',
-                'triggered_by': {
-                    'temperature_difference': temp_diff_front,
-                    'front_left_temp': tire_data.front_left_temp,
-                    'front_right_temp': tire_data.front_right_temp
-                }
-            })
-        
-        # Check for overheating tires
-        if tire_data.front_left_temp > 110 or tire_data.front_right_temp > 110:
-            alerts.append({
-                'vehicle': tire_data.telemetry.vehicle,
-                'alert_type': 'TIRE_WEAR',
-                'severity': 'HIGH',
-                'title': 'High Tire Temperatures',
-                'message': f'Tire temperatures exceeding optimal range (>{110}°C)',
-                'recommended_action': 'Consider reducing pace or adjusting setup',
-                'triggered_by': {
-                    'front_left_temp': tire_data.front_left_temp,
-                    'front_right_temp': tire_data.front_right_temp
-                }
-            })
-        
-        # Check pressure anomalies
-        pressure_diff_front = abs(tire_data.front_left_pressure - tire_data.front_right_pressure)
-        if pressure_diff_front > 1.0:  # 1.0 PSI difference threshold
-            alerts.append({
-                'vehicle': tire_data.telemetry.vehicle,
-                'alert_type': 'SYSTEM_WARNING',
-                'severity': 'MEDIUM',
-                'title': 'Uneven Tire Pressures',
-                'message': f'Front tire pressure difference: {pressure_diff_front:.1f} PSI',
-                'recommended_action': 'Check for leaks and adjust pressures',
-                'triggered_by': {
-                    'pressure_difference': pressure_diff_front,
-                    'front_left_pressure': tire_data.front_left_pressure,
-                    'front_right_pressure': tire_data.front_right_pressure
-                }
-            })
+        alerts = [
+            Alert(**alert_data)
+            for tire_data in tire_rows
+            for alert_data in _tire_alert_data(tire_data)
+        ]
         
-        # Create alerts
-        for alert_data in alerts:
-            Alert.objects.create(**alert_data)
+        # Create alerts in one INSERT; bulk_create skips post_save, so drop
+        # the cached dashboard summary here
+        if alerts:
+            Alert.objects.bulk_create(alerts, batch_size=500)
+            cache.delete(Alert.SUMMARY_CACHE_KEY)
             
     except Exception as e:
         print(f"Error checking tire alerts: {e}")
@@ -6,7 +6,7 @@ from utils.data_processors import TelemetryProcessor, WeatherProcessor
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 
-@shared_task
+@shared_task(ignore_result=True)
 def process_live_telemetry():
     """Process incoming telemetry data and broadcast via WebSocket"""
     try:
@@ -30,7 +30,7 @@ def process_live_telemetry():
     except Exception as e:
         return f"Error processing telemetry: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def ingest_external_telemetry(source_url=None):
     """Ingest telemetry data from external sources"""
     try:
@@ -65,7 +65,7 @@ def ingest_external_telemetry(source_url=None):
     except Exception as e:
         return f"Error ingesting external telemetry: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def cleanup_old_telemetry(hours_old=24):
     """Clean up telemetry data older than specified hours"""
     try:
@@ -79,7 +79,7 @@ def cleanup_old_telemetry(hours_old=24):
     except Exception as e:
         return f"Error cleaning up telemetry: {str(e)}"
 
-@shared_task
+@shared_task(ignore_result=True)
 def update_weather_data():
     """Update weather data from external sources"""
     try:
@@ -1,3 +1,68 @@
-from django.test import TestCase
+import random
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
 
-# Create your tests here.
+from alerts.models import Alert
+from management.commands import ingest_telemetry, simulate_race
+from utils.data_processors import TelemetryProcessor, WeatherProcessor
+from .models import TelemetryData, TireTelemetry
+from .signals import _tire_alert_data
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class IngestTelemetryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        random.seed(86)
+    
+    def test_bulk_ingest_runs_side_effects_once_per_batch(self):
+        with mock.patch.object(ingest_telemetry, 'broadcast_new_telemetry') as broadcast, \
+                mock.patch.object(ingest_telemetry, 'broadcast_weather_updates') as broadcast_weather, \
+                mock.patch('telemetry.signals.get_channel_layer') as get_channel_layer, \
+                self.captureOnCommitCallbacks(execute=True):
+            get_channel_layer.return_value.group_send = mock.AsyncMock()
+            ingest_telemetry.Command(stdout=StringIO()).handle(source='simulate', count=2)
+        
+        # 20 demo vehicles per batch, each with one tire row
+        self.assertEqual(TelemetryData.objects.count(), 40)
+        self.assertEqual(TireTelemetry.objects.count(), 40)
+        newest_id = TelemetryData.objects.order_by('-id').values_list('id', flat=True).first()
+        self.assertEqual(cache.get(TelemetryData.LATEST_ID_CACHE_KEY), newest_id)
+        
+        broadcast.assert_called_once()
+        self.assertEqual([row.pk for row in broadcast.call_args.args[0]],
+                         list(TelemetryData.objects.order_by('id').values_list('id', flat=True)))
+        self.assertEqual(len(broadcast_weather.call_args.args[0]), 1)
+        self.assertEqual(get_channel_layer.return_value.group_send.await_count, 40)
+        
+        # Tire alerts are checked for every stored tire row
+        expected_alerts = [
+            alert_data['title']
+            for tire_data in TireTelemetry.objects.select_related('telemetry__vehicle').order_by('id')
+            for alert_data in _tire_alert_data(tire_data)
+        ]
+        self.assertTrue(expected_alerts)
+        self.assertEqual(list(Alert.objects.order_by('id').values_list('title', flat=True)), expected_alerts)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SimulateRaceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+    
+    def test_simulated_lap_is_broadcast_once_per_batch(self):
+        command = simulate_race.Command(stdout=StringIO())
+        with mock.patch.object(simulate_race, 'broadcast_new_telemetry') as broadcast:
+            command._simulate_lap(1, timezone.now(), TelemetryProcessor(), WeatherProcessor(), None)
+        
+        self.assertEqual(TelemetryData.objects.count(), 20)
+        broadcast.assert_called_once()
+        rows = broadcast.call_args.args[0]
+        self.assertEqual(len(rows), 20)
+        self.assertTrue(all(row.pk and row.lap_number == 1 for row in rows))
+        self.assertEqual(cache.get(TelemetryData.LATEST_ID_CACHE_KEY), rows[-1].pk)
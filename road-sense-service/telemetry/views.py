@@ -17,7 +17,8 @@ class VehicleViewSet(viewsets.ModelViewSet):
     serializer_class = VehicleSerializer
 
 class TelemetryDataViewSet(viewsets.ModelViewSet):
-    queryset = TelemetryData.objects.all().order_by('-timestamp')
+    # TelemetryDataSerializer nests the vehicle and tire telemetry; join them once
+    queryset = TelemetryData.objects.select_related('vehicle', 'tiretelemetry').order_by('-timestamp')
     serializer_class = TelemetryDataSerializer  # Add this line
     permission_classes = [CanAccessLiveData]
     
@@ -25,8 +26,8 @@ class TelemetryDataViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
         
         # Filter by user's preferred vehicle if set
-        if self.request.user.is_authenticated and self.request.user.preferred_vehicle:
-            queryset = queryset.filter(vehicle=self.request.user.preferred_vehicle)
+        if self.request.user.is_authenticated and self.request.user.preferred_vehicle_id:
+            queryset = queryset.filter(vehicle_id=self.request.user.preferred_vehicle_id)
         
         return queryset
     
@@ -34,13 +35,14 @@ class TelemetryDataViewSet(viewsets.ModelViewSet):
     def current(self, request):
         """Get current telemetry - user-specific based on preferences"""
         # Use user's preferred vehicle or show all
-        if request.user.is_authenticated and request.user.preferred_vehicle:
-            recent_telemetry = TelemetryData.objects.filter(
-                vehicle=request.user.preferred_vehicle,
+        recent_telemetry = TelemetryData.objects.select_related('vehicle', 'tiretelemetry')
+        if request.user.is_authenticated and request.user.preferred_vehicle_id:
+            recent_telemetry = recent_telemetry.filter(
+                vehicle_id=request.user.preferred_vehicle_id,
                 timestamp__gte=timezone.now() - timedelta(seconds=10)
             )
         else:
-            recent_telemetry = TelemetryData.objects.filter(
+            recent_telemetry = recent_telemetry.filter(
                 timestamp__gte=timezone.now() - timedelta(seconds=10)
             )
         
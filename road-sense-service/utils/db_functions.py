@@ -0,0 +1,13 @@
+from django.db.models import FloatField, Func
+
+class DurationSeconds(Func):
+    """Seconds in a DurationField as a float, computed by PostgreSQL"""
+    template = 'EXTRACT(EPOCH FROM %(expressions)s)'
+    output_field = FloatField()
+
+def sector_seconds():
+    """Annotations for the three sector times in seconds"""
+    return {
+        f'sector{i}_seconds': DurationSeconds(f'sector{i}_time')
+        for i in range(1, 4)
+    }